@@ -15,7 +15,7 @@ const JOINT_ENABLE_LIMIT_PROBABILITY = evolutionConfig.dnaGeneration.jointEnable
 
 export const PI = Math.PI;
 
-export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block', 'wheel'])) {
+export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block', 'wheel']), rng = Math.random) {
   const parts = [];
   const joints = [];
 
@@ -23,10 +23,10 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
   parts.push({
     id: 0,
     kind: 'block',
-    w: randomRange(0.5, 1.5),
-    h: randomRange(0.5, 1.5),
-    density: randomRange(1, 5),
-    friction: randomRange(0.1, 0.9)
+    w: randomRange(rng, 0.5, 1.5),
+    h: randomRange(rng, 0.5, 1.5),
+    density: randomRange(rng, 1, 5),
+    friction: randomRange(rng, 0.1, 0.9)
   });
 
   // Randomly generate wheels + extra parts (up to max parts)
@@ -38,14 +38,14 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
   let wheelCount = 0;
 
   while (partCount < targetParts) {
-    const parentId = Math.floor(Math.random() * partCount); // Pick a random existing part
+    const parentId = Math.floor(rng() * partCount); // Pick a random existing part
     const id = partCount;
 
     // Decide kind based on unlocked parts
     let kind = 'block';
-    if (wheelCount < MAX_WHEELS && unlockedParts.has('wheel') && Math.random() < WHEEL_PROBABILITY) {
+    if (wheelCount < MAX_WHEELS && unlockedParts.has('wheel') && rng() < WHEEL_PROBABILITY) {
       kind = 'wheel';
-    } else if (Math.random() < SPECIAL_PART_PROBABILITY) {
+    } else if (rng() < SPECIAL_PART_PROBABILITY) {
       // Try to pick a special part
       const options = [];
       if (unlockedParts.has('big_wheel') && wheelCount < MAX_WHEELS) options.push('big_wheel');
@@ -55,24 +55,24 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
       if (unlockedParts.has('jetpack')) options.push('jetpack');
 
       if (options.length > 0) {
-        kind = options[Math.floor(Math.random() * options.length)];
+        kind = options[Math.floor(rng() * options.length)];
       }
     }
 
     if (kind === 'wheel') {
       const def = PART_DEFINITIONS.wheel;
-      const baseMotorSpeed = randomRange(
+      const baseMotorSpeed = randomRange(rng,
         evolutionConfig.dnaGeneration.motorSpeed.min,
         evolutionConfig.dnaGeneration.motorSpeed.max
       );
       parts.push({
         id,
         kind: 'wheel',
-        radius: randomRange(0.3, 0.8),
-        density: randomRange(1, 4),
-        friction: randomRange(0.2, 1.0),
+        radius: randomRange(rng, 0.3, 0.8),
+        density: randomRange(rng, 1, 4),
+        friction: randomRange(rng, 0.2, 1.0),
         motorSpeed: baseMotorSpeed * def.motorMultiplier,
-        maxMotorTorque: randomRange(
+        maxMotorTorque: randomRange(rng,
           evolutionConfig.dnaGeneration.maxMotorTorque.min,
           evolutionConfig.dnaGeneration.maxMotorTorque.max
         )
@@ -82,14 +82,14 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
       parts.push({
         id,
         kind: 'big_wheel',
-        radius: randomRange(PART_DEFINITIONS.big_wheel.minRadius, PART_DEFINITIONS.big_wheel.maxRadius),
-        density: randomRange(1, 4),
-        friction: randomRange(0.2, 1.0),
-        motorSpeed: randomRange(
+        radius: randomRange(rng, PART_DEFINITIONS.big_wheel.minRadius, PART_DEFINITIONS.big_wheel.maxRadius),
+        density: randomRange(rng, 1, 4),
+        friction: randomRange(rng, 0.2, 1.0),
+        motorSpeed: randomRange(rng,
           evolutionConfig.dnaGeneration.motorSpeed.min,
           evolutionConfig.dnaGeneration.motorSpeed.max
         ),
-        maxMotorTorque: randomRange(
+        maxMotorTorque: randomRange(rng,
           evolutionConfig.dnaGeneration.maxMotorTorque.min,
           evolutionConfig.dnaGeneration.maxMotorTorque.max
         )
@@ -99,25 +99,25 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
       parts.push({
         id,
         kind: 'long_body',
-        w: randomRange(PART_DEFINITIONS.long_body.minW, PART_DEFINITIONS.long_body.maxW),
-        h: randomRange(PART_DEFINITIONS.long_body.minH, PART_DEFINITIONS.long_body.maxH),
-        density: randomRange(0.5, 3),
-        friction: randomRange(0.1, 0.9)
+        w: randomRange(rng, PART_DEFINITIONS.long_body.minW, PART_DEFINITIONS.long_body.maxW),
+        h: randomRange(rng, PART_DEFINITIONS.long_body.minH, PART_DEFINITIONS.long_body.maxH),
+        density: randomRange(rng, 0.5, 3),
+        friction: randomRange(rng, 0.1, 0.9)
       });
     } else if (kind === 'small_wheel') {
       const def = PART_DEFINITIONS.small_wheel;
-      const baseMotorSpeed = randomRange(
+      const baseMotorSpeed = randomRange(rng,
         evolutionConfig.dnaGeneration.motorSpeed.min,
         evolutionConfig.dnaGeneration.motorSpeed.max
       );
       parts.push({
         id,
         kind: 'small_wheel',
-        radius: randomRange(def.minRadius, def.maxRadius),
-        density: randomRange(1, 4),
-        friction: randomRange(0.2, 1.0),
+        radius: randomRange(rng, def.minRadius, def.maxRadius),
+        density: randomRange(rng, 1, 4),
+        friction: randomRange(rng, 0.2, 1.0),
         motorSpeed: baseMotorSpeed * def.motorMultiplier,
-        maxMotorTorque: randomRange(
+        maxMotorTorque: randomRange(rng,
           evolutionConfig.dnaGeneration.maxMotorTorque.min,
           evolutionConfig.dnaGeneration.maxMotorTorque.max
         ),
@@ -126,18 +126,18 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
       wheelCount++;
     } else if (kind === 'tiny_wheel') {
       const def = PART_DEFINITIONS.tiny_wheel;
-      const baseMotorSpeed = randomRange(
+      const baseMotorSpeed = randomRange(rng,
         evolutionConfig.dnaGeneration.motorSpeed.min,
         evolutionConfig.dnaGeneration.motorSpeed.max
       );
       parts.push({
         id,
         kind: 'tiny_wheel',
-        radius: randomRange(def.minRadius, def.maxRadius),
-        density: randomRange(1, 4),
-        friction: randomRange(0.2, 1.0),
+        radius: randomRange(rng, def.minRadius, def.maxRadius),
+        density: randomRange(rng, 1, 4),
+        friction: randomRange(rng, 0.2, 1.0),
         motorSpeed: baseMotorSpeed * def.motorMultiplier,
-        maxMotorTorque: randomRange(
+        maxMotorTorque: randomRange(rng,
           evolutionConfig.dnaGeneration.maxMotorTorque.min,
           evolutionConfig.dnaGeneration.maxMotorTorque.max
         ),
@@ -158,10 +158,10 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
       parts.push({
         id,
         kind: 'block',
-        w: randomRange(0.2, 1.0),
-        h: randomRange(0.2, 1.0),
-        density: randomRange(0.5, 3),
-        friction: randomRange(0.1, 0.9)
+        w: randomRange(rng, 0.2, 1.0),
+        h: randomRange(rng, 0.2, 1.0),
+        density: randomRange(rng, 0.5, 3),
+        friction: randomRange(rng, 0.1, 0.9)
       });
     }
 
@@ -173,29 +173,29 @@ export function createRandomDNA(maxParts = 8, unlockedParts = new Set(['block',
     joints.push({
       childId: id,
       parentId: parentId,
-      anchorX: randomRange(
+      anchorX: randomRange(rng,
         evolutionConfig.dnaGeneration.jointAnchors.min,
         evolutionConfig.dnaGeneration.jointAnchors.max
       ),
-      anchorY: randomRange(
+      anchorY: randomRange(rng,
         evolutionConfig.dnaGeneration.jointAnchors.min,
         evolutionConfig.dnaGeneration.jointAnchors.max
       ),
       jointType: 'revolute',
-      enableLimit: Math.random() < JOINT_ENABLE_LIMIT_PROBABILITY,
-      lowerAngle: randomRange(
+      enableLimit: rng() < JOINT_ENABLE_LIMIT_PROBABILITY,
+      lowerAngle: randomRange(rng,
         evolutionConfig.dnaGeneration.jointAngles.lowerMin,
         evolutionConfig.dnaGeneration.jointAngles.lowerMax
       ),
-      upperAngle: randomRange(
+      upperAngle: randomRange(rng,
         evolutionConfig.dnaGeneration.jointAngles.upperMin,
         evolutionConfig.dnaGeneration.jointAngles.upperMax
       ),
-      breakForce: randomRange(
+      breakForce: randomRange(rng,
         evolutionConfig.dnaGeneration.jointBreakForce.min,
         evolutionConfig.dnaGeneration.jointBreakForce.max
       ),
-      breakTorque: randomRange(
+      breakTorque: randomRange(rng,
         evolutionConfig.dnaGeneration.jointBreakTorque.min,
         evolutionConfig.dnaGeneration.jointBreakTorque.max
       )
@@ -216,8 +216,8 @@ export function validateDNA(dna) {
   return true;
 }
 
-function randomRange(min, max) {
-  return Math.random() * (max - min) + min;
+function randomRange(rng, min, max) {
+  return rng() * (max - min) + min;
 }
 
 export function cloneDNA(dna) {
@@ -1,6 +1,7 @@
 
-import { pickParentRoulette } from './select.js';
-import { subtreeCrossover, mutatePerField, normalizeAndClamp } from './mutate.js';
+import { createSelectionTable, pickIndex } from './select.js';
+import { crossoverPacked, mutatePacked, normalizePacked } from './mutate.js';
+import { createPackedGenome, copyPacked, packDNA, unpackDNA } from './packedGenome.js';
 import { cloneDNA, createRandomDNA } from './dna.js';
 import { getEvolutionConfig } from '../utils/configLoader.js';
 
@@ -9,15 +10,15 @@ const evolutionConfig = await getEvolutionConfig();
 const ELITE_COUNT = evolutionConfig.eliteCount;
 const CROSSOVER_RATE = evolutionConfig.crossoverRate;
 
-export function createFirstGeneration(popSize = 100, maxParts = 8, unlockedParts) {
+export function createFirstGeneration(popSize = 100, maxParts = 8, unlockedParts, rng = Math.random) {
     const pop = [];
     for (let i = 0; i < popSize; i++) {
-        pop.push(createRandomDNA(maxParts, unlockedParts));
+        pop.push(createRandomDNA(maxParts, unlockedParts, rng));
     }
     return pop;
 }
 
-export function nextGeneration(prevPop, { popSize = 100, mutRate = 0.02, maxParts = 8, unlockedParts } = {}) {
+export function nextGeneration(prevPop, { popSize = 100, mutRate = 0.02, maxParts = 8, unlockedParts, rng = Math.random } = {}) {
     // prevPop is array of { dna, fitness }
 
     // 1. Sort by fitness desc
@@ -30,30 +31,46 @@ export function nextGeneration(prevPop, { popSize = 100, mutRate = 0.02, maxPart
             nextDNAs.push(cloneDNA(sorted[i].dna));
         } else {
             // Fallback if small pop
-            nextDNAs.push(createRandomDNA(maxParts, unlockedParts));
+            nextDNAs.push(createRandomDNA(maxParts, unlockedParts, rng));
         }
     }
 
-    // 3. Breeding
-    const dnas = prevPop.map(p => p.dna);
-    const fitnesses = prevPop.map(p => p.fitness);
+    // 3. Breeding (packed genomes; parents packed and roulette table built once)
+    const parents = prevPop.map(p => packDNA(p.dna));
+    const table = createSelectionTable(prevPop.map(p => p.fitness));
+    const child = createPackedGenome();
 
     while (nextDNAs.length < popSize) {
-        const p1 = pickParentRoulette(dnas, fitnesses);
-        const p2 = pickParentRoulette(dnas, fitnesses);
+        const p1 = parents[pickIndex(table, rng)];
+        const p2 = parents[pickIndex(table, rng)];
 
-        let child;
-        if (Math.random() < CROSSOVER_RATE) {
-            child = subtreeCrossover(p1, p2);
+        if (rng() < CROSSOVER_RATE) {
+            crossoverPacked(p1, p2, child, rng);
         } else {
-            child = cloneDNA(p1);
+            copyPacked(p1, child);
         }
 
-        child = mutatePerField(child, mutRate);
-        child = normalizeAndClamp(child);
+        mutatePacked(child, mutRate, rng);
+        normalizePacked(child, rng);
 
-        nextDNAs.push(child);
+        nextDNAs.push(unpackDNA(child));
     }
 
     return nextDNAs;
 }
+
+export async function evolveGenerations(population, generations, evaluatePopulation, options = {}) {
+    // Headless fast-forward: evaluate -> breed, repeated without rendering.
+    // evaluatePopulation(dnas) must resolve to [{ dna, fitness }] in population order.
+    const { onGeneration, ...breedOptions } = options;
+
+    let current = population;
+    let results = [];
+    for (let g = 0; g < generations; g++) {
+        results = await evaluatePopulation(current);
+        if (onGeneration) onGeneration(results, g);
+        current = nextGeneration(results, breedOptions);
+    }
+
+    return { population: current, results };
+}
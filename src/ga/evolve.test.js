@@ -1,6 +1,7 @@
 import { describe, it, expect } from 'vitest';
-import { createFirstGeneration, nextGeneration } from './evolve.js';
+import { createFirstGeneration, nextGeneration, evolveGenerations } from './evolve.js';
 import { createRandomDNA, cloneDNA } from './dna.js';
+import { createRng } from '../utils/random.js';
 
 describe('evolve.js', () => {
     // B-14: Given popSize=10, When createFirstGeneration(10) is called, Then it returns an array of length 10
@@ -33,4 +34,32 @@ describe('evolve.js', () => {
         const topEliteWidth = next[0].parts[0].w;
         expect(topEliteWidth).toBe(20);
     });
+
+    // B-20261017-090002: Given an async evaluator, When evolveGenerations(pop, 3) runs, Then it evaluates three generations and returns a full population
+    it('evolveGenerations fast-forwards through headless generations', async () => {
+        const pop = createFirstGeneration(10, 4);
+        let evaluated = 0;
+        const evaluatePopulation = async (dnas) => {
+            evaluated++;
+            return dnas.map((dna, i) => ({ dna, fitness: i }));
+        };
+
+        const { population, results } = await evolveGenerations(pop, 3, evaluatePopulation, { popSize: 10 });
+
+        expect(evaluated).toBe(3);
+        expect(results.length).toBe(10);
+        expect(population.length).toBe(10);
+    });
+
+    // B-20261017-100003: Given the same seed, When two runs breed a generation, Then they produce identical populations
+    it('seeded runs are reproducible', () => {
+        const run = () => {
+            const rng = createRng(1234);
+            const pop = createFirstGeneration(10, 6, undefined, rng);
+            const results = pop.map((dna, i) => ({ dna, fitness: i * 3 }));
+            return nextGeneration(results, { popSize: 10, mutRate: 0.2, rng });
+        };
+
+        expect(run()).toEqual(run());
+    });
 });
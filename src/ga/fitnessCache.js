@@ -0,0 +1,110 @@
+/**
+ * Fitness Cache
+ * Maps genome content hashes to fitness so unchanged genomes (elites, clones,
+ * children that escaped mutation) skip physics entirely.
+ * Only valid with a deterministic evaluator such as evaluate() in simulate.js,
+ * where each car runs alone in its own world.
+ */
+
+const DEFAULT_MAX_ENTRIES = 2000;
+
+/**
+ * Content hash of a genome (53-bit cyrb53 over its JSON form)
+ * @param {Object} dna - The DNA object {parts: [], joints: []}
+ * @returns {string} Hash key
+ */
+export function hashDNA(dna) {
+    const str = JSON.stringify(dna);
+    let h1 = 0xdeadbeef;
+    let h2 = 0x41c6ce57;
+    for (let i = 0; i < str.length; i++) {
+        const ch = str.charCodeAt(i);
+        h1 = Math.imul(h1 ^ ch, 2654435761);
+        h2 = Math.imul(h2 ^ ch, 1597334677);
+    }
+    h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+    h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+    return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+}
+
+export class FitnessCache {
+    constructor(maxEntries = DEFAULT_MAX_ENTRIES) {
+        this.maxEntries = maxEntries;
+        this.entries = new Map(); // hash -> fitness, oldest first
+        this.hits = 0;
+        this.misses = 0;
+    }
+
+    get size() {
+        return this.entries.size;
+    }
+
+    get(key) {
+        if (!this.entries.has(key)) {
+            this.misses++;
+            return undefined;
+        }
+        // Refresh recency by re-inserting at the end
+        const fitness = this.entries.get(key);
+        this.entries.delete(key);
+        this.entries.set(key, fitness);
+        this.hits++;
+        return fitness;
+    }
+
+    set(key, fitness) {
+        this.entries.delete(key);
+        this.entries.set(key, fitness);
+        while (this.entries.size > this.maxEntries) {
+            // Evict least recently used (first in insertion order)
+            this.entries.delete(this.entries.keys().next().value);
+        }
+    }
+
+    clear() {
+        this.entries.clear();
+        this.hits = 0;
+        this.misses = 0;
+    }
+}
+
+/**
+ * Wrap a population evaluator so cached and duplicate genomes are not re-simulated
+ * @param {Function} evaluatePopulation - async (dnas) => [{ dna, fitness }]
+ * @param {FitnessCache} cache
+ * @returns {Function} async (dnas) => [{ dna, fitness }] in population order
+ */
+export function withFitnessCache(evaluatePopulation, cache) {
+    return async (dnas) => {
+        const keys = dnas.map(hashDNA);
+        const fitnesses = new Array(dnas.length);
+        const pending = new Map(); // hash -> first index needing simulation
+
+        keys.forEach((key, i) => {
+            if (pending.has(key)) return;
+            const cached = cache.get(key);
+            if (cached !== undefined) {
+                fitnesses[i] = cached;
+            } else {
+                pending.set(key, i);
+            }
+        });
+
+        const fresh = new Map(); // hash -> fitness simulated this call
+        if (pending.size > 0) {
+            const indices = [...pending.values()];
+            const results = await evaluatePopulation(indices.map(i => dnas[i]));
+            results.forEach((result, n) => {
+                const key = keys[indices[n]];
+                fresh.set(key, result.fitness);
+                cache.set(key, result.fitness);
+            });
+        }
+
+        // Duplicates within the generation share the first copy's result
+        return dnas.map((dna, i) => ({
+            dna,
+            fitness: fitnesses[i] !== undefined ? fitnesses[i] : fresh.get(keys[i])
+        }));
+    };
+}
@@ -0,0 +1,43 @@
+import { describe, it, expect } from 'vitest';
+import { FitnessCache, hashDNA, withFitnessCache } from './fitnessCache.js';
+import { createRandomDNA, cloneDNA } from './dna.js';
+
+describe('fitnessCache.js', () => {
+    // B-20261017-100000: Given a cloned genome, When hashDNA() is called on both, Then the hashes match
+    it('hashDNA gives identical genomes the same key', () => {
+        const dna = createRandomDNA(4);
+        const other = createRandomDNA(4);
+        expect(hashDNA(cloneDNA(dna))).toBe(hashDNA(dna));
+        expect(hashDNA(other)).not.toBe(hashDNA(dna));
+    });
+
+    // B-20261017-100001: Given a full cache, When a new entry is added, Then the least recently used entry is evicted
+    it('evicts the least recently used entry', () => {
+        const cache = new FitnessCache(2);
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.get('a');
+        cache.set('c', 3);
+
+        expect(cache.size).toBe(2);
+        expect(cache.get('b')).toBeUndefined();
+        expect(cache.get('a')).toBe(1);
+    });
+
+    // B-20261017-100002: Given elites and duplicates in a generation, When evaluated through the cache, Then only unseen genomes are simulated
+    it('withFitnessCache simulates each unseen genome once', async () => {
+        const simulated = [];
+        const evaluatePopulation = async (dnas) => {
+            simulated.push(...dnas);
+            return dnas.map(dna => ({ dna, fitness: dna.parts.length }));
+        };
+        const evaluateCached = withFitnessCache(evaluatePopulation, new FitnessCache());
+        const elite = createRandomDNA(4);
+
+        await evaluateCached([elite]);
+        const results = await evaluateCached([cloneDNA(elite), createRandomDNA(3), cloneDNA(elite)]);
+
+        expect(simulated.length).toBe(2);
+        expect(results.map(r => r.fitness)).toEqual([elite.parts.length, results[1].dna.parts.length, elite.parts.length]);
+    });
+});
@@ -1,251 +1,224 @@
 
-import { cloneDNA, PI } from './dna.js';
-import { getEvolutionConfig } from '../utils/configLoader.js';
+import {
+    GENOME_CAPACITY, PART_STRIDE, JOINT_STRIDE, KIND_NAMES,
+    F_W, F_H, F_RADIUS, F_DENSITY, F_FRICTION, F_MOTOR_SPEED, F_MAX_MOTOR_TORQUE,
+    J_ANCHOR_X, J_ANCHOR_Y, J_LOWER_ANGLE, J_UPPER_ANGLE, J_BREAK_FORCE, J_BREAK_TORQUE,
+    copyPacked, copySlot, createPackedGenome, getKindCode, packDNA, unpackDNA
+} from './packedGenome.js';
+import { getEvolutionConfig, getGameConfig } from '../utils/configLoader.js';
 
 // Load mutation configuration
 const evolutionConfig = await getEvolutionConfig();
+const gameConfig = await getGameConfig();
 const mutationConfig = evolutionConfig.mutation;
 
-// --- Helpers ---
-
-function buildAdjacency(dna) {
-    const adj = new Map(); // id -> [{childId, jointDef}]
-    // Initialize for all parts
-    dna.parts.forEach(p => adj.set(p.id, []));
-    dna.joints.forEach(j => {
-        if (adj.has(j.parentId)) {
-            adj.get(j.parentId).push(j);
-        }
-    });
-    return adj;
+// --- Packed genome operators ---
+// Work in place on packed genomes (see packedGenome.js) using preallocated
+// scratch buffers.
+
+const WHEEL_KINDS = ['wheel', 'big_wheel', 'small_wheel', 'tiny_wheel'];
+const IS_WHEEL_CODE = new Uint8Array(KIND_NAMES.length);
+WHEEL_KINDS.forEach(kind => { IS_WHEEL_CODE[getKindCode(kind)] = 1; });
+const WHEEL_CODE = getKindCode('wheel');
+
+const PACKED_MAX_PARTS = gameConfig.dna.maxParts;
+const PACKED_MAX_WHEELS = gameConfig.dna.maxWheels;
+
+// Scratch buffers reused by every call
+const inSub1 = new Uint8Array(GENOME_CAPACITY);
+const inSub2 = new Uint8Array(GENOME_CAPACITY);
+const remap1 = new Int16Array(GENOME_CAPACITY);
+const remap2 = new Int16Array(GENOME_CAPACITY);
+const childCounts = new Int16Array(GENOME_CAPACITY);
+const leafSlots = new Int16Array(GENOME_CAPACITY);
+const wheelLeafSlots = new Int16Array(GENOME_CAPACITY);
+
+function randDelta(rng, mag) {
+    return (rng() * 2 - 1) * mag;
 }
 
-function getSubtreeIds(adj, rootId, result = new Set()) {
-    result.add(rootId);
-    const children = adj.get(rootId);
-    if (children) {
-        for (const c of children) {
-            getSubtreeIds(adj, c.childId, result);
-        }
-    }
-    return result;
+function clamp(val, min, max) {
+    return Math.min(Math.max(val, min), max);
 }
 
-function getAllIds(dna) {
-    return new Set(dna.parts.map(p => p.id));
+function mutateValue(data, offset, config, rate, rng) {
+    if (rng() < rate) data[offset] = clamp(data[offset] + randDelta(rng, config.delta), config.min, config.max);
 }
 
-// --- Mutations ---
-
-export function mutatePerField(dna, rate = 0.02) {
-    // Modify numeric fields
+export function mutatePacked(genome, rate = 0.02, rng = Math.random) {
+    const partProps = mutationConfig.partProperties;
+    const jointProps = mutationConfig.jointProperties;
+    const parts = genome.partData;
+    const joints = genome.jointData;
 
     // Parts
-    dna.parts.forEach(p => {
-        const isWheel = ['wheel', 'big_wheel', 'small_wheel', 'tiny_wheel'].includes(p.kind);
-        if (isWheel) {
-            const wheelRadiusConfig = mutationConfig.partProperties.wheelRadius;
-            const densityConfig = mutationConfig.partProperties.density;
-            const frictionConfig = mutationConfig.partProperties.friction;
-            const motorSpeedConfig = mutationConfig.partProperties.motorSpeed;
-            const motorTorqueConfig = mutationConfig.partProperties.maxMotorTorque;
-
-            if (Math.random() < rate) p.radius = clamp(p.radius + randDelta(wheelRadiusConfig.delta), wheelRadiusConfig.min, wheelRadiusConfig.max);
-            if (Math.random() < rate) p.density = clamp(p.density + randDelta(densityConfig.delta), densityConfig.min, densityConfig.max);
-            if (Math.random() < rate) p.friction = clamp(p.friction + randDelta(frictionConfig.delta), frictionConfig.min, frictionConfig.max);
-            if (Math.random() < rate) p.motorSpeed = clamp(p.motorSpeed + randDelta(motorSpeedConfig.delta), motorSpeedConfig.min, motorSpeedConfig.max);
-            if (Math.random() < rate) p.maxMotorTorque = clamp(p.maxMotorTorque + randDelta(motorTorqueConfig.delta), motorTorqueConfig.min, motorTorqueConfig.max);
+    for (let slot = 0; slot < genome.count; slot++) {
+        const base = slot * PART_STRIDE;
+        if (IS_WHEEL_CODE[genome.kinds[slot]]) {
+            mutateValue(parts, base + F_RADIUS, partProps.wheelRadius, rate, rng);
+            mutateValue(parts, base + F_DENSITY, partProps.density, rate, rng);
+            mutateValue(parts, base + F_FRICTION, partProps.friction, rate, rng);
+            mutateValue(parts, base + F_MOTOR_SPEED, partProps.motorSpeed, rate, rng);
+            mutateValue(parts, base + F_MAX_MOTOR_TORQUE, partProps.maxMotorTorque, rate, rng);
         } else {
-            const widthConfig = mutationConfig.partProperties.blockWidth;
-            const heightConfig = mutationConfig.partProperties.blockHeight;
-            const densityConfig = mutationConfig.partProperties.density;
-            const frictionConfig = mutationConfig.partProperties.friction;
-
-            if (Math.random() < rate) p.w = clamp(p.w + randDelta(widthConfig.delta), widthConfig.min, widthConfig.max);
-            if (Math.random() < rate) p.h = clamp(p.h + randDelta(heightConfig.delta), heightConfig.min, heightConfig.max);
-            if (Math.random() < rate) p.density = clamp(p.density + randDelta(densityConfig.delta), densityConfig.min, densityConfig.max);
-            if (Math.random() < rate) p.friction = clamp(p.friction + randDelta(frictionConfig.delta), frictionConfig.min, frictionConfig.max);
+            mutateValue(parts, base + F_W, partProps.blockWidth, rate, rng);
+            mutateValue(parts, base + F_H, partProps.blockHeight, rate, rng);
+            mutateValue(parts, base + F_DENSITY, partProps.density, rate, rng);
+            mutateValue(parts, base + F_FRICTION, partProps.friction, rate, rng);
         }
-    });
+    }
 
-    // Joints
-    dna.joints.forEach(j => {
-        const anchorXConfig = mutationConfig.jointProperties.anchorX;
-        const anchorYConfig = mutationConfig.jointProperties.anchorY;
-        const lowerAngleConfig = mutationConfig.jointProperties.lowerAngle;
-        const upperAngleConfig = mutationConfig.jointProperties.upperAngle;
-        const breakForceConfig = mutationConfig.jointProperties.breakForce;
-        const breakTorqueConfig = mutationConfig.jointProperties.breakTorque;
-
-        if (Math.random() < rate) j.anchorX = clamp(j.anchorX + randDelta(anchorXConfig.delta), anchorXConfig.min, anchorXConfig.max);
-        if (Math.random() < rate) j.anchorY = clamp(j.anchorY + randDelta(anchorYConfig.delta), anchorYConfig.min, anchorYConfig.max);
-        if (Math.random() < rate) j.lowerAngle = clamp(j.lowerAngle + randDelta(lowerAngleConfig.delta), lowerAngleConfig.min, lowerAngleConfig.max);
-        if (Math.random() < rate) j.upperAngle = clamp(j.upperAngle + randDelta(upperAngleConfig.delta), upperAngleConfig.min, upperAngleConfig.max);
-        if (Math.random() < rate) j.breakForce = clamp(j.breakForce + randDelta(breakForceConfig.delta), breakForceConfig.min, breakForceConfig.max);
-        if (Math.random() < rate) j.breakTorque = clamp(j.breakTorque + randDelta(breakTorqueConfig.delta), breakTorqueConfig.min, breakTorqueConfig.max);
+    // Joints (slot 0 is the root and has none)
+    for (let slot = 1; slot < genome.count; slot++) {
+        const base = slot * JOINT_STRIDE;
+        mutateValue(joints, base + J_ANCHOR_X, jointProps.anchorX, rate, rng);
+        mutateValue(joints, base + J_ANCHOR_Y, jointProps.anchorY, rate, rng);
+        mutateValue(joints, base + J_LOWER_ANGLE, jointProps.lowerAngle, rate, rng);
+        mutateValue(joints, base + J_UPPER_ANGLE, jointProps.upperAngle, rate, rng);
+        mutateValue(joints, base + J_BREAK_FORCE, jointProps.breakForce, rate, rng);
+        mutateValue(joints, base + J_BREAK_TORQUE, jointProps.breakTorque, rate, rng);
 
         // Ensure angle limits sanity
-        if (j.lowerAngle > j.upperAngle) {
-            const t = j.lowerAngle; j.lowerAngle = j.upperAngle; j.upperAngle = t;
+        if (joints[base + J_LOWER_ANGLE] > joints[base + J_UPPER_ANGLE]) {
+            const t = joints[base + J_LOWER_ANGLE];
+            joints[base + J_LOWER_ANGLE] = joints[base + J_UPPER_ANGLE];
+            joints[base + J_UPPER_ANGLE] = t;
         }
-    });
-
-    return dna;
-}
+    }
 
-function randDelta(mag) {
-    return (Math.random() * 2 - 1) * mag;
+    return genome;
 }
 
-function clamp(val, min, max) {
-    return Math.min(Math.max(val, min), max);
-}
-
-// --- Crossover ---
-
-export function subtreeCrossover(p1, p2) {
-    let child = cloneDNA(p1);
-
-    // 1. Pick Cut Point in Child (copy of p1)
-    // Must be non-root
-    const ids1 = p1.parts.map(p => p.id).filter(id => id !== 0);
-    if (ids1.length === 0) return child; // No subtrees to swap
-
-    // 2. Pick Cut Point in p2
-    const ids2 = p2.parts.map(p => p.id).filter(id => id !== 0);
-    if (ids2.length === 0) return child; // p2 has no subtrees
-
-    const cutId1 = ids1[Math.floor(Math.random() * ids1.length)];
-    const cutId2 = ids2[Math.floor(Math.random() * ids2.length)];
-
-    // 3. Identify Subtrees
-    const adj1 = buildAdjacency(child);
-    const sub1 = getSubtreeIds(adj1, cutId1);
-
-    const adj2 = buildAdjacency(p2);
-    const sub2 = getSubtreeIds(adj2, cutId2);
-
-    // 4. Find Attachment Info for Cut1 (Parent in Child)
-    // We need to know who 'cutId1' is attached to in 'child'
-    const joint1 = child.joints.find(j => j.childId === cutId1);
-    if (!joint1) return child; // Should not happen
-
-    const parentId = joint1.parentId; // The staying parent
-    const jointTemplate = { ...joint1 }; // Copy joint props
-
-    // 5. Remove Subtree 1 from Child
-    child.parts = child.parts.filter(p => !sub1.has(p.id));
-    child.joints = child.joints.filter(j => !sub1.has(j.childId)); // Remove all joints where child is in subtree
-    // Note: Joints INTERNAL to the subtree are removed because their ChildId is in the subtree.
-    // The connection joint to the parent is also removed (childId=cutId1).
-
-    // 6. Insert Subtree 2
-    // We need to renumber Subtree 2 parts to avoid collisions with Child's existing parts.
-    // Existing IDs in Child
-    const existingIds = new Set(child.parts.map(p => p.id));
-    let nextId = Math.max(...existingIds, 0) + 1;
-
-    const idMap = new Map(); // p2 id -> new id
-    for (const oldId of sub2) {
-        idMap.set(oldId, nextId++);
+function markSubtree(genome, rootSlot, mark) {
+    // Slots are topologically ordered, so one forward pass finds every descendant
+    mark.fill(0, 0, genome.count);
+    mark[rootSlot] = 1;
+    for (let slot = rootSlot + 1; slot < genome.count; slot++) {
+        mark[slot] = mark[genome.parents[slot]];
     }
+}
 
-    // Add Parts
-    for (const oldId of sub2) {
-        const pDef = p2.parts.find(p => p.id === oldId);
-        if (!pDef) continue;
-        const newPart = { ...pDef, id: idMap.get(oldId) };
-        child.parts.push(newPart);
+export function crossoverPacked(p1, p2, out, rng = Math.random) {
+    // No subtrees to swap
+    if (p1.count <= 1 || p2.count <= 1) return copyPacked(p1, out);
+
+    // Cut points are non-root slots
+    const cut1 = 1 + Math.floor(rng() * (p1.count - 1));
+    const cut2 = 1 + Math.floor(rng() * (p2.count - 1));
+    markSubtree(p1, cut1, inSub1);
+    markSubtree(p2, cut2, inSub2);
+
+    // Keep p1 minus the cut subtree; kept parts keep their ids
+    let n = 0;
+    let nextId = 0;
+    for (let slot = 0; slot < p1.count; slot++) {
+        if (inSub1[slot]) continue;
+        if (n >= out.capacity) break;
+        remap1[slot] = n;
+        copySlot(p1, slot, out, n, slot === 0 ? -1 : remap1[p1.parents[slot]]);
+        nextId = Math.max(nextId, p1.ids[slot] + 1);
+        n++;
     }
 
-    // Add Internal Joints of Subtree 2
-    for (const j of p2.joints) {
-        if (sub2.has(j.childId) && sub2.has(j.parentId)) {
-            child.joints.push({
-                ...j,
-                childId: idMap.get(j.childId),
-                parentId: idMap.get(j.parentId)
-            });
+    // Graft p2's subtree onto the staying parent
+    const attachParent = remap1[p1.parents[cut1]];
+    for (let slot = cut2; slot < p2.count; slot++) {
+        if (!inSub2[slot]) continue;
+        if (n >= out.capacity) break;
+        remap2[slot] = n;
+
+        if (slot === cut2) {
+            copySlot(p2, slot, out, n, attachParent);
+            // Use the joint definition from the old branch (p1's attachment point)
+            out.limits[n] = p1.limits[cut1];
+            for (let f = 0; f < JOINT_STRIDE; f++) {
+                out.jointData[n * JOINT_STRIDE + f] = p1.jointData[cut1 * JOINT_STRIDE + f];
+            }
+        } else {
+            copySlot(p2, slot, out, n, remap2[p2.parents[slot]]);
         }
+        // Grafted parts are renumbered after p1's to avoid collisions
+        out.ids[n] = nextId++;
+        n++;
     }
 
-    // 7. Connect Subtree 2 Root to Parent
-    // Root of Sub2 is cutId2
-    const newRootId = idMap.get(cutId2);
-
-    child.joints.push({
-        ...jointTemplate, // Use the joint definition from the old branch
-        childId: newRootId,
-        parentId: parentId
-        // anchorX, anchorY etc are preserved from p1's attachment point
-    });
-
-    return child;
+    out.count = n;
+    return out;
 }
 
-// --- Normalization ---
-
-export function normalizeAndClamp(dna) {
-    // 1. Check Limits
-    const MAX_PARTS = 12;
-    const MAX_WHEELS = 4;
+function removeLeafSlot(genome, target) {
+    // Shift later slots down one; parent indices above the target move with them
+    for (let slot = target + 1; slot < genome.count; slot++) {
+        const parent = genome.parents[slot];
+        copySlot(genome, slot, genome, slot - 1, parent > target ? parent - 1 : parent);
+    }
+    genome.count--;
+}
 
-    // Prune if too many
-    // Loop until compliant
+export function normalizePacked(genome, rng = Math.random) {
+    // Prune leaves until within part/wheel limits
     let loopGuard = 0;
     while (loopGuard++ < 50) {
-        const parts = dna.parts;
-        const wheels = parts.filter(p => p.kind === 'wheel').length;
+        let wheels = 0;
+        for (let slot = 0; slot < genome.count; slot++) {
+            if (genome.kinds[slot] === WHEEL_CODE) wheels++;
+        }
+
+        if (genome.count <= PACKED_MAX_PARTS && wheels <= PACKED_MAX_WHEELS) break;
 
-        if (parts.length <= MAX_PARTS && wheels <= MAX_WHEELS) break;
+        childCounts.fill(0, 0, genome.count);
+        for (let slot = 1; slot < genome.count; slot++) {
+            childCounts[genome.parents[slot]]++;
+        }
 
-        // Pick a leaf to prune
-        const adj = buildAdjacency(dna);
-        const leaves = parts.filter(p => p.id !== 0 && (!adj.has(p.id) || adj.get(p.id).length === 0));
+        let leafCount = 0;
+        let wheelLeafCount = 0;
+        for (let slot = 1; slot < genome.count; slot++) {
+            if (childCounts[slot] !== 0) continue;
+            leafSlots[leafCount++] = slot;
+            if (genome.kinds[slot] === WHEEL_CODE) wheelLeafSlots[wheelLeafCount++] = slot;
+        }
 
-        if (leaves.length === 0) break; // Should not happen if size > 1
+        if (leafCount === 0) break;
 
         // Strategy: if wheels too many, prioritize wheel leaves
-        let target = leaves[Math.floor(Math.random() * leaves.length)];
-        if (wheels > MAX_WHEELS) {
-            const wheelLeaves = leaves.filter(p => p.kind === 'wheel');
-            if (wheelLeaves.length > 0) {
-                target = wheelLeaves[Math.floor(Math.random() * wheelLeaves.length)];
-            }
+        let target = leafSlots[Math.floor(rng() * leafCount)];
+        if (wheels > PACKED_MAX_WHEELS && wheelLeafCount > 0) {
+            target = wheelLeafSlots[Math.floor(rng() * wheelLeafCount)];
         }
 
-        // Remove target
-        dna.parts = dna.parts.filter(p => p.id !== target.id);
-        dna.joints = dna.joints.filter(j => j.childId !== target.id);
-        // Also remove any joints where it was a parent (it's a leaf so none, but for safety)
-        dna.joints = dna.joints.filter(j => j.parentId !== target.id);
+        removeLeafSlot(genome, target);
     }
 
-    // 2. Renumber IDs to be 0..N-1 (Optional, but nice for clean internal state)
-    // Actually, simple incrementing ID is safer?
-    // Let's standardise IDs to be contiguous 0..Count-1
-    // to keep ID numbers low.
-
-    const oldToNew = new Map();
-    // Root must be 0 and exist
-    const root = dna.parts.find(p => p.id === 0);
-    if (!root) {
-        // Emergency repair: make first part root
-        if (dna.parts.length > 0) dna.parts[0].id = 0;
-    }
+    return genome;
+}
 
-    // Sort parts so ID 0 is first, then rest
-    dna.parts.sort((a, b) => a.id - b.id);
+// --- DNA object operators ---
+// Pack, run the packed operator above, and unpack.
 
-    dna.parts.forEach((p, index) => {
-        oldToNew.set(p.id, index);
-        p.id = index;
-    });
+export function mutatePerField(dna, rate = 0.02, rng = Math.random) {
+    const mutated = unpackDNA(mutatePacked(packDNA(dna), rate, rng));
+    dna.parts = mutated.parts;
+    dna.joints = mutated.joints;
+    return dna;
+}
+
+export function subtreeCrossover(p1, p2, rng = Math.random) {
+    return unpackDNA(crossoverPacked(packDNA(p1), packDNA(p2), createPackedGenome(), rng));
+}
+
+export function normalizeAndClamp(dna, rng = Math.random) {
+    const normalized = unpackDNA(normalizePacked(packDNA(dna), rng));
 
-    dna.joints.forEach(j => {
-        if (oldToNew.has(j.childId)) j.childId = oldToNew.get(j.childId);
-        if (oldToNew.has(j.parentId)) j.parentId = oldToNew.get(j.parentId);
+    // Standardise IDs to be contiguous 0..Count-1 to keep ID numbers low
+    const oldToNew = new Map(normalized.parts.map((p, index) => [p.id, index]));
+    normalized.parts.forEach(p => { p.id = oldToNew.get(p.id); });
+    normalized.joints.forEach(j => {
+        j.childId = oldToNew.get(j.childId);
+        j.parentId = oldToNew.get(j.parentId);
     });
 
+    dna.parts = normalized.parts;
+    dna.joints = normalized.joints;
     return dna;
 }
@@ -1,6 +1,7 @@
 import { describe, it, expect } from 'vitest';
-import { mutatePerField, subtreeCrossover, normalizeAndClamp } from './mutate.js';
+import { mutatePerField, subtreeCrossover, normalizeAndClamp, mutatePacked, normalizePacked } from './mutate.js';
 import { createRandomDNA, cloneDNA } from './dna.js';
+import { packDNA } from './packedGenome.js';
 
 describe('mutate.js', () => {
     // B-9: Given a DNA with rate=0, When mutatePerField() is called, Then numeric fields remain unchanged
@@ -62,4 +63,23 @@ describe('mutate.js', () => {
         const ids = normalized.parts.map(p => p.id);
         expect(ids).toEqual([0, 1, 2]);
     });
+
+    // B-20261017-130003: Given a packed genome with rate=0, When mutatePacked() is called, Then its records are unchanged
+    it('mutatePacked with rate=0 preserves packed records', () => {
+        const genome = packDNA(createRandomDNA(6));
+        const before = Float64Array.from(genome.partData);
+        mutatePacked(genome, 0);
+        expect(genome.partData).toEqual(before);
+    });
+
+    // B-20261017-130004: Given a packed genome with 6 wheels, When normalizePacked() is called, Then wheels are pruned to 4
+    it('normalizePacked limits wheels to 4', () => {
+        const dna = { parts: [{ id: 0, kind: 'block', w: 1, h: 1, density: 1, friction: 0.5 }], joints: [] };
+        for (let i = 1; i <= 6; i++) {
+            dna.parts.push({ id: i, kind: 'wheel', radius: 0.5, density: 1, friction: 0.5, motorSpeed: 10, maxMotorTorque: 50 });
+            dna.joints.push({ childId: i, parentId: 0, anchorX: 0, anchorY: 0, jointType: 'revolute', enableLimit: false, lowerAngle: 0, upperAngle: 0, breakForce: 1000, breakTorque: 500 });
+        }
+        const genome = normalizePacked(packDNA(dna));
+        expect(genome.count).toBe(5);
+    });
 });
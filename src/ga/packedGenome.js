@@ -0,0 +1,197 @@
+/**
+ * Packed Genome
+ * Fixed-stride typed-array form of a DNA tree used by the breeding hot path.
+ *
+ * Slot i holds part i and the joint attaching it to its parent, so a tree of
+ * N parts needs exactly N records. Slots are kept in topological order
+ * (parents[i] < i, root in slot 0), which lets subtree walks run as one
+ * forward pass without recursion or adjacency maps. Each slot also keeps the
+ * part's id from the source DNA, and records are Float64, so a genome that
+ * breeding leaves untouched unpacks to exactly the DNA it was packed from
+ * (and hits the fitness cache).
+ */
+
+import { PART_DEFINITIONS } from '../gameConfig.js';
+import { getGameConfig } from '../utils/configLoader.js';
+
+const gameConfig = await getGameConfig();
+
+// Room for a crossover child before normalization prunes it back to maxParts
+export const GENOME_CAPACITY = gameConfig.dna.maxParts * 2;
+
+// Part record fields (Float64Array, PART_STRIDE per slot)
+export const PART_FIELDS = ['w', 'h', 'radius', 'density', 'friction', 'motorSpeed', 'maxMotorTorque', 'breakMultiplier', 'thrust'];
+export const PART_STRIDE = PART_FIELDS.length;
+export const F_W = 0;
+export const F_H = 1;
+export const F_RADIUS = 2;
+export const F_DENSITY = 3;
+export const F_FRICTION = 4;
+export const F_MOTOR_SPEED = 5;
+export const F_MAX_MOTOR_TORQUE = 6;
+
+// Joint record fields (Float64Array, JOINT_STRIDE per slot; slot 0 unused)
+export const JOINT_FIELDS = ['anchorX', 'anchorY', 'lowerAngle', 'upperAngle', 'breakForce', 'breakTorque'];
+export const JOINT_STRIDE = JOINT_FIELDS.length;
+export const J_ANCHOR_X = 0;
+export const J_ANCHOR_Y = 1;
+export const J_LOWER_ANGLE = 2;
+export const J_UPPER_ANGLE = 3;
+export const J_BREAK_FORCE = 4;
+export const J_BREAK_TORQUE = 5;
+
+// Part kinds are stored as small integer codes
+export const KIND_NAMES = Object.keys(PART_DEFINITIONS);
+const KIND_CODES = new Map(KIND_NAMES.map((kind, code) => [kind, code]));
+
+export function getKindCode(kind) {
+    const code = KIND_CODES.get(kind);
+    if (code === undefined) {
+        throw new Error(`Unknown part kind: ${kind}`);
+    }
+    return code;
+}
+
+/**
+ * Allocate an empty packed genome
+ * @param {number} capacity - Maximum number of parts
+ * @returns {Object} Packed genome
+ */
+export function createPackedGenome(capacity = GENOME_CAPACITY) {
+    return {
+        capacity,
+        count: 0,
+        ids: new Int16Array(capacity), // Part id in the DNA object
+        kinds: new Int16Array(capacity),
+        fieldMasks: new Int16Array(capacity), // Bit k set = PART_FIELDS[k] present
+        parents: new Int16Array(capacity), // Root = -1
+        limits: new Int16Array(capacity), // Joint enableLimit (0/1)
+        partData: new Float64Array(capacity * PART_STRIDE),
+        jointData: new Float64Array(capacity * JOINT_STRIDE)
+    };
+}
+
+export function copyPacked(src, dst) {
+    dst.count = src.count;
+    dst.ids.set(src.ids);
+    dst.kinds.set(src.kinds);
+    dst.fieldMasks.set(src.fieldMasks);
+    dst.parents.set(src.parents);
+    dst.limits.set(src.limits);
+    dst.partData.set(src.partData);
+    dst.jointData.set(src.jointData);
+    return dst;
+}
+
+/**
+ * Copy one slot's part and joint record between genomes
+ */
+export function copySlot(src, srcSlot, dst, dstSlot, parent) {
+    dst.ids[dstSlot] = src.ids[srcSlot];
+    dst.kinds[dstSlot] = src.kinds[srcSlot];
+    dst.fieldMasks[dstSlot] = src.fieldMasks[srcSlot];
+    dst.parents[dstSlot] = parent;
+    dst.limits[dstSlot] = src.limits[srcSlot];
+    for (let f = 0; f < PART_STRIDE; f++) {
+        dst.partData[dstSlot * PART_STRIDE + f] = src.partData[srcSlot * PART_STRIDE + f];
+    }
+    for (let f = 0; f < JOINT_STRIDE; f++) {
+        dst.jointData[dstSlot * JOINT_STRIDE + f] = src.jointData[srcSlot * JOINT_STRIDE + f];
+    }
+}
+
+/**
+ * Convert a DNA object into packed form
+ * Parts are laid out breadth-first from the root; unreachable parts are dropped
+ * (buildCar never builds them either).
+ * @param {Object} dna - The DNA object {parts: [], joints: []}
+ * @param {Object} out - Destination genome (allocated if omitted)
+ * @returns {Object} Packed genome
+ */
+export function packDNA(dna, out = createPackedGenome()) {
+    const definitions = new Map();
+    dna.parts.forEach(p => definitions.set(p.id, p));
+    const adj = new Map(); // parentId -> [jointDef]
+    dna.joints.forEach(j => {
+        if (!adj.has(j.parentId)) adj.set(j.parentId, []);
+        adj.get(j.parentId).push(j);
+    });
+
+    out.count = 0;
+    const queue = [{ id: 0, parent: -1, joint: null }];
+    const visited = new Set();
+
+    for (let q = 0; q < queue.length && out.count < out.capacity; q++) {
+        const { id, parent, joint } = queue[q];
+        if (visited.has(id)) continue;
+        const partDef = definitions.get(id);
+        if (!partDef) continue;
+        visited.add(id);
+
+        const slot = out.count++;
+        out.ids[slot] = id;
+        out.kinds[slot] = getKindCode(partDef.kind);
+        out.parents[slot] = parent;
+
+        let mask = 0;
+        for (let f = 0; f < PART_STRIDE; f++) {
+            const value = partDef[PART_FIELDS[f]];
+            out.partData[slot * PART_STRIDE + f] = value ?? 0;
+            if (value !== undefined) mask |= 1 << f;
+        }
+        out.fieldMasks[slot] = mask;
+
+        out.limits[slot] = joint && joint.enableLimit ? 1 : 0;
+        for (let f = 0; f < JOINT_STRIDE; f++) {
+            out.jointData[slot * JOINT_STRIDE + f] = joint ? joint[JOINT_FIELDS[f]] : 0;
+        }
+
+        for (const j of adj.get(id) || []) {
+            queue.push({ id: j.childId, parent: slot, joint: j });
+        }
+    }
+
+    return out;
+}
+
+/**
+ * Convert a packed genome back to the DNA object shape used by buildCar and export
+ * Parts and joints come out in id order, which is the order createRandomDNA
+ * and earlier unpacks produce, so an unchanged genome round-trips exactly.
+ * @param {Object} genome - Packed genome
+ * @returns {Object} DNA {parts: [], joints: []}
+ */
+export function unpackDNA(genome) {
+    const parts = [];
+    const joints = [];
+    const ids = genome.ids;
+    const order = [];
+    for (let slot = 0; slot < genome.count; slot++) order.push(slot);
+    order.sort((a, b) => ids[a] - ids[b]);
+
+    for (const slot of order) {
+        const part = { id: ids[slot], kind: KIND_NAMES[genome.kinds[slot]] };
+        const mask = genome.fieldMasks[slot];
+        for (let f = 0; f < PART_STRIDE; f++) {
+            if (mask & (1 << f)) part[PART_FIELDS[f]] = genome.partData[slot * PART_STRIDE + f];
+        }
+        parts.push(part);
+
+        if (slot === 0) continue;
+        const base = slot * JOINT_STRIDE;
+        joints.push({
+            childId: ids[slot],
+            parentId: ids[genome.parents[slot]],
+            anchorX: genome.jointData[base + J_ANCHOR_X],
+            anchorY: genome.jointData[base + J_ANCHOR_Y],
+            jointType: 'revolute',
+            enableLimit: genome.limits[slot] === 1,
+            lowerAngle: genome.jointData[base + J_LOWER_ANGLE],
+            upperAngle: genome.jointData[base + J_UPPER_ANGLE],
+            breakForce: genome.jointData[base + J_BREAK_FORCE],
+            breakTorque: genome.jointData[base + J_BREAK_TORQUE]
+        });
+    }
+
+    return { parts, joints };
+}
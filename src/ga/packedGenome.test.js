@@ -0,0 +1,46 @@
+import { describe, it, expect } from 'vitest';
+import { packDNA, unpackDNA, createPackedGenome } from './packedGenome.js';
+import { crossoverPacked } from './mutate.js';
+import { createRandomDNA } from './dna.js';
+import { hashDNA } from './fitnessCache.js';
+
+const ALL_PARTS = new Set(['block', 'wheel', 'big_wheel', 'long_body', 'jetpack', 'small_wheel', 'tiny_wheel']);
+
+describe('packedGenome.js', () => {
+    // B-20261017-130000: Given a DNA object, When it is packed and unpacked, Then parts, kinds and joint links survive
+    it('round-trips DNA through the packed form', () => {
+        const dna = createRandomDNA(10, ALL_PARTS);
+
+        const restored = unpackDNA(packDNA(dna));
+
+        expect(restored.parts.length).toBe(dna.parts.length);
+        expect(restored.joints.length).toBe(dna.joints.length);
+        expect(restored.parts.map(p => p.kind).sort()).toEqual(dna.parts.map(p => p.kind).sort());
+        expect(restored.parts[0].w).toBeCloseTo(dna.parts[0].w, 5);
+    });
+
+    // B-20261017-200000: Given a DNA object, When it is packed and unpacked unchanged, Then it hashes like the original
+    it('round-trips ids and full precision so the fitness cache hits', () => {
+        const dna = createRandomDNA(10, ALL_PARTS);
+
+        const restored = unpackDNA(packDNA(dna));
+
+        expect(restored).toEqual(dna);
+        expect(hashDNA(restored)).toBe(hashDNA(dna));
+    });
+
+    // B-20261017-130001: Given two packed parents, When crossoverPacked() writes a child, Then every joint links an earlier parent slot
+    it('crossoverPacked produces a valid tree', () => {
+        const child = createPackedGenome();
+        for (let i = 0; i < 20; i++) {
+            const p1 = packDNA(createRandomDNA(8, ALL_PARTS));
+            const p2 = packDNA(createRandomDNA(8, ALL_PARTS));
+
+            const dna = unpackDNA(crossoverPacked(p1, p2, child));
+
+            expect(dna.parts[0].id).toBe(0);
+            expect(dna.joints.length).toBe(dna.parts.length - 1);
+            expect(dna.joints.every(j => j.parentId < j.childId)).toBe(true);
+        }
+    });
+});
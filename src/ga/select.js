@@ -1,28 +1,52 @@
-
 import { cloneDNA } from './dna.js';
 
-export function pickParentRoulette(pop, fitnesses) {
-    // 1. Calculate Weights
-    const weights = fitnesses.map(f => Math.max(0, f));
-    const sumW = weights.reduce((a, b) => a + b, 0);
+/**
+ * Build a roulette table once per generation
+ * @param {Array<number>} fitnesses
+ * @returns {Object} { prefix: Float64Array of cumulative weights, total }
+ */
+export function createSelectionTable(fitnesses) {
+    const prefix = new Float64Array(fitnesses.length);
+    let total = 0;
+    for (let i = 0; i < fitnesses.length; i++) {
+        total += Math.max(0, fitnesses[i]);
+        prefix[i] = total;
+    }
+    return { prefix, total };
+}
+
+/**
+ * Pick an index by fitness-proportional roulette in O(log n)
+ * @param {Object} table - From createSelectionTable()
+ * @param {Function} rng
+ * @returns {number} Selected index
+ */
+export function pickIndex(table, rng = Math.random) {
+    const { prefix, total } = table;
+    const n = prefix.length;
 
-    // 2. Selection
-    if (sumW === 0) {
+    if (total === 0) {
         // Uniform
-        const idx = Math.floor(Math.random() * pop.length);
-        return cloneDNA(pop[idx]);
+        return Math.floor(rng() * n);
     }
 
-    let r = Math.random() * sumW;
-    let cum = 0;
-
-    for (let i = 0; i < pop.length; i++) {
-        cum += weights[i];
-        if (cum >= r) {
-            return cloneDNA(pop[i]);
+    // First index whose cumulative weight exceeds r; zero-weight entries add
+    // nothing to the prefix, so they can never be chosen (even when rng() is 0)
+    const r = rng() * total;
+    let lo = 0;
+    let hi = n - 1;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (prefix[mid] > r) {
+            hi = mid;
+        } else {
+            lo = mid + 1;
         }
     }
+    return lo;
+}
 
-    // Fallback (rounding errors)
-    return cloneDNA(pop[pop.length - 1]);
+export function pickParentRoulette(pop, fitnesses, rng = Math.random) {
+    const table = createSelectionTable(fitnesses);
+    return cloneDNA(pop[pickIndex(table, rng)]);
 }
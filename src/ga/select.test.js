@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { pickParentRoulette } from './select.js';
+import { pickParentRoulette, createSelectionTable, pickIndex } from './select.js';
 import { createRandomDNA } from './dna.js';
 
 describe('select.js', () => {
@@ -18,4 +18,14 @@ describe('select.js', () => {
         const result = pickParentRoulette(pop, fitnesses);
         expect(result.parts).toBeDefined();
     });
+
+    // B-20261017-130002: Given a selection table with zero-weight entries, When pickIndex() is called, Then zero-fitness entries are never chosen
+    it('pickIndex never selects zero-fitness entries', () => {
+        const table = createSelectionTable([0, 5, 0, 10]);
+        for (let i = 0; i < 200; i++) {
+            expect([1, 3]).toContain(pickIndex(table));
+        }
+        expect(pickIndex(table, () => 0)).toBe(1);
+        expect(pickIndex(table, () => 0.9999)).toBe(3);
+    });
 });
@@ -15,7 +15,13 @@ const initialMutRate = parseInt(mutationSlider.value) / 100;
 const initialPopSize = parseInt(popSlider.value);
 const initialMaxParts = parseInt(dnaSlider.value);
 
-const app = new App(canvas, { popSize: initialPopSize, mutRate: initialMutRate, maxParts: initialMaxParts });
+// ?profile enables hot-path timings, drawn under the HUD; window.carGaProfiler.dump() exports them
+const profile = new URLSearchParams(window.location.search).has('profile');
+
+const app = new App(canvas, { popSize: initialPopSize, mutRate: initialMutRate, maxParts: initialMaxParts, profile });
+if (profile) {
+  window.carGaProfiler = app.profiler;
+}
 
 // Resize handling
 function resize() {
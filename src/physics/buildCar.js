@@ -1,28 +1,42 @@
 
 import * as planck from 'planck-js';
 
-import assetDimensions from '../render/assetDimensions.json';
 import * as partRegistry from '../partRegistry.js';
+import {
+    BODY_STRIDE, B_X, B_Y, B_ANGLE, B_VX, B_VY, B_W,
+    JOINT_STRIDE, J_LOCAL_A_X, J_LOCAL_A_Y, J_LOCAL_B_X, J_LOCAL_B_Y, J_REFERENCE_ANGLE
+} from './carSnapshot.js';
+
+// Detect if we're running in Node.js or browser
+const isNode = typeof process !== 'undefined' && process.versions != null && process.versions.node != null;
+
+// Sprite dimensions, loaded like configLoader loads config so plain Node (workers, benchmark) can read them too
+const assetDimensionsUrl = new URL('../render/assetDimensions.json', import.meta.url);
+const assetDimensions = isNode
+    ? JSON.parse((await import('node:fs')).readFileSync(assetDimensionsUrl, 'utf-8'))
+    : await (await fetch(assetDimensionsUrl)).json();
 
 const SCALE = 20; // Pixels per meter
 
-export function buildCar(world, dna, position, carId) {
-    const parts = new Map(); // id -> body
-    const joints = [];
+// Collision filtering:
+// Category 2 = Car Part
+// Mask 1 = Ground (World static objects)
+const CAR_CATEGORY = 0x0002;
+const GROUND_CATEGORY = 0x0001;
+const CAR_MASK = GROUND_CATEGORY;
 
-    // Collision filtering:
-    // Category 2 = Car Part
-    // Mask 1 = Ground (World static objects)
-    const CAR_CATEGORY = 0x0002;
-    const GROUND_CATEGORY = 0x0001;
-    const CAR_MASK = GROUND_CATEGORY;
-
-    // Create Bodies (Parts)
-    dna.parts.forEach(partDef => {
-        let body;
-        const initPos = position.clone();
-    });
+const LINEAR_DAMPING = 0.1;
+const ANGULAR_DAMPING = 0.05;
 
+/**
+ * Precompute everything about a car that does not depend on where it is built:
+ * build order, shapes/fixture definitions (incl. asset lookups) and joint definitions.
+ * A blueprint can be instantiated any number of times, in any world.
+ * @param {Object} dna - The DNA object {parts: [], joints: []}
+ * @param {number} carId - Car id (only seeds the sprite choice, which sets part dimensions)
+ * @returns {Object} { parts, partsById, joints }
+ */
+export function createCarBlueprint(dna, carId) {
     // 1. Organize tree
     const adj = new Map(); // parentId -> [{childId, jointDef}]
     const definitions = new Map();
@@ -32,147 +46,223 @@ export function buildCar(world, dna, position, carId) {
         adj.get(j.parentId).push(j);
     });
 
-    // 2. Build recursively starting from Root
-    // Helper to build
-    function buildPart(partDef, pos, angle) {
-        const type = 'dynamic';
-        const body = world.createBody({
-            type,
-            position: pos,
-            angle: angle,
-            linearDamping: 0.1,
-            angularDamping: 0.05
-        });
-
-        // Set carId and visual type
-        // Use partDef.kind to determine visual asset
-        // We can add simple logic to pick variants later if we want more randomness
-        body.setUserData({
-            carId: carId,
-            partKind: partDef.kind, // 'block', 'wheel', 'long_body', 'jetpack', 'big_wheel'
-            partId: partDef.id
-        });
-
-        // Determine correct dimension from assets
-        let w = partDef.w;
-        let h = partDef.h;
-        let r = partDef.radius;
-
-        // Visual Asset Logic - use partRegistry for sprite mapping
-        const seed = (carId || 0) + (partDef.id || 0);
-        const spriteName = partRegistry.getSpriteNameForPart(partDef.kind, seed);
-
-        // Apply visual dimensions if asset exists
-        if (spriteName && assetDimensions[spriteName]) {
-            const dims = assetDimensions[spriteName];
-            // Convert pixels to meters
-            // Scale down by 0.25 to keep parts reasonably sized
-            const SPRITE_SCALE = 0.25;
-            w = (dims.w / SCALE) * SPRITE_SCALE;
-            h = (dims.h / SCALE) * SPRITE_SCALE;
-            // For wheels, approximate radius
-            r = Math.min(w, h) / 2;
-        }
-
-        // Use partRegistry for shape type determination
-        let shape;
-        const shapeType = partRegistry.getShapeType(partDef.kind);
-        if (shapeType === 'circle') {
-            shape = planck.Circle(r);
-        } else {
-            shape = planck.Box(w / 2, h / 2);
-        }
-
-        body.createFixture({
-            shape: shape,
-            density: partDef.density,
-            friction: partDef.friction,
-            filterCategoryBits: CAR_CATEGORY,
-            filterMaskBits: CAR_MASK,
-            filterGroupIndex: -1 // Backup to prevent self-collision
-        });
-
-        parts.set(partDef.id, body);
-        return body;
-    }
-
-    // BFS or DFS to build
-    const queue = [{ id: 0, pos: position, angle: 0 }];
+    // 2. Parts in build (BFS) order; each is placed at its parent's anchor
+    const parts = [];
+    const partsById = new Map();
+    const queue = [{ id: 0, parentIndex: -1, anchorX: 0, anchorY: 0 }];
     const visited = new Set();
 
     while (queue.length > 0) {
-        const { id, pos, angle } = queue.shift();
+        const { id, parentIndex, anchorX, anchorY } = queue.shift();
         if (visited.has(id)) continue;
         visited.add(id);
 
         const partDef = definitions.get(id);
         if (!partDef) continue; // Should not happen in valid DNA
 
-        const body = buildPart(partDef, pos, angle);
+        const part = { partDef, parentIndex, anchorX, anchorY, fixtureDef: createFixtureDef(partDef, carId) };
+        const index = parts.push(part) - 1;
+        partsById.set(id, part);
 
         // Process children
-        const children = adj.get(id) || [];
-        for (const j of children) {
-            // Calculate child position based on joint anchor
-            // Joint has anchorX/Y relative to Parent.
-            // But we don't know where the Child *center* should be relative to that anchor?
-            // Usually standard logic: Two bodies, two anchors.
-            // DNA spec: `anchorX, anchorY` (singular).
-            // "anchorX, anchorY, jointType...".
-            // Typically this means the anchor ON THE PARENT.
-            // Where does it attach to the child?
-            // If not specified, maybe child center? Or DNA needs 2 anchors?
-            // SOP: "joints entries: { childId, parentId, anchorX, anchorY... }"
-            // Ambiguous. Let's assume anchor is on Parent, and Child attaches at its Center?
-            // OR the single anchor is the world space point? No, DNA is relative.
-            // Let's assume Anchor is on Parent, and Child Center is mapped to that Anchor?
-            // That would put the wheel/block center exactly on the joint.
-            // This is plausible for "building block" style. 
-
-            // Calc world point for anchor
-            // Parent Body Local point (anchorX, anchorY) -> World Point
-            const anchorLocal = planck.Vec2(j.anchorX, j.anchorY);
-            const anchorWorld = body.getWorldPoint(anchorLocal);
-
-            // So Child Body will be created at anchorWorld
-            queue.push({ id: j.childId, pos: anchorWorld, angle: 0 });
+        // Anchor is on the parent (local anchorX/anchorY); the child's center is placed on it
+        for (const j of adj.get(id) || []) {
+            queue.push({ id: j.childId, parentIndex: index, anchorX: j.anchorX, anchorY: j.anchorY });
         }
     }
 
-    // 3. Create Joints
-    // Now that all bodies exist
+    // 3. Joints in DNA order, between parts that were built
+    const joints = [];
     dna.joints.forEach(j => {
-        const parent = parts.get(j.parentId);
-        const child = parts.get(j.childId);
-        if (!parent || !child) return;
+        if (j.jointType !== 'revolute') return;
+        if (!partsById.has(j.parentId) || !partsById.has(j.childId)) return;
+        const child = definitions.get(j.childId);
 
-        // Anchor in world space?
-        // We know anchor is local to parent (j.anchorX, j.anchorY).
-        // RevoluteJointDef usually takes world anchor.
-        const anchorLocal = planck.Vec2(j.anchorX, j.anchorY);
-        const anchorWorld = parent.getWorldPoint(anchorLocal);
-
-        if (j.jointType === 'revolute') {
-            const joint = planck.RevoluteJoint({
+        joints.push({
+            parentId: j.parentId,
+            childId: j.childId,
+            anchorX: j.anchorX,
+            anchorY: j.anchorY,
+            jointDef: {
                 enableLimit: j.enableLimit,
                 lowerAngle: j.lowerAngle,
                 upperAngle: j.upperAngle,
-                enableMotor: partRegistry.hasMotor(definitions.get(j.childId).kind),
-                motorSpeed: definitions.get(j.childId).motorSpeed || 0,
-                maxMotorTorque: definitions.get(j.childId).maxMotorTorque || 0
-            }, parent, child, anchorWorld);
-
-            // Store break thresholds in userData for simulation step
-            joint.setUserData({
-                breakForce: j.breakForce,
-                breakTorque: j.breakTorque,
-                isBroken: false
-            });
-
-            world.createJoint(joint);
-            joints.push(joint);
-        }
+                enableMotor: partRegistry.hasMotor(child.kind),
+                motorSpeed: child.motorSpeed || 0,
+                maxMotorTorque: child.maxMotorTorque || 0
+            },
+            breakForce: j.breakForce,
+            breakTorque: j.breakTorque
+        });
     });
 
+    return { parts, partsById, joints };
+}
+
+function getPartSpriteName(partDef, carId) {
+    // Visual Asset Logic - use partRegistry for sprite mapping
+    const seed = (carId || 0) + (partDef.id || 0);
+    return partRegistry.getSpriteNameForPart(partDef.kind, seed);
+}
+
+/**
+ * Key identifying everything createCarBlueprint() depends on: the DNA and the sprites
+ * its parts resolve to. Cars with equal keys can share a blueprint whatever their carId.
+ * @param {Object} dna - The DNA object
+ * @param {number} carId - Car id
+ * @param {string} dnaHash - hashDNA(dna)
+ * @returns {string}
+ */
+export function getBlueprintKey(dna, carId, dnaHash) {
+    let key = dnaHash;
+    for (const partDef of dna.parts) {
+        key += ':' + getPartSpriteName(partDef, carId);
+    }
+    return key;
+}
+
+function createFixtureDef(partDef, carId) {
+    // Determine correct dimension from assets
+    let w = partDef.w;
+    let h = partDef.h;
+    let r = partDef.radius;
+
+    const spriteName = getPartSpriteName(partDef, carId);
+
+    // Apply visual dimensions if asset exists
+    if (spriteName && assetDimensions[spriteName]) {
+        const dims = assetDimensions[spriteName];
+        // Convert pixels to meters
+        // Scale down by 0.25 to keep parts reasonably sized
+        const SPRITE_SCALE = 0.25;
+        w = (dims.w / SCALE) * SPRITE_SCALE;
+        h = (dims.h / SCALE) * SPRITE_SCALE;
+        // For wheels, approximate radius
+        r = Math.min(w, h) / 2;
+    }
+
+    // Use partRegistry for shape type determination
+    // Shapes are never mutated by the solver, so every instance of the blueprint shares them
+    let shape;
+    const shapeType = partRegistry.getShapeType(partDef.kind);
+    if (shapeType === 'circle') {
+        shape = planck.Circle(r);
+    } else {
+        shape = planck.Box(w / 2, h / 2);
+    }
+
+    return {
+        shape: shape,
+        density: partDef.density,
+        friction: partDef.friction,
+        filterCategoryBits: CAR_CATEGORY,
+        filterMaskBits: CAR_MASK,
+        filterGroupIndex: -1 // Backup to prevent self-collision
+    };
+}
+
+function createPartBody(world, part, carId, bodyDef, partIndex) {
+    const body = world.createBody({
+        type: 'dynamic',
+        linearDamping: LINEAR_DAMPING,
+        angularDamping: ANGULAR_DAMPING,
+        ...bodyDef
+    });
+
+    // Set carId and visual type
+    body.setUserData({
+        carId: carId,
+        partKind: part.partDef.kind, // 'block', 'wheel', 'long_body', 'jetpack', 'big_wheel'
+        partId: part.partDef.id
+    });
+    body.createFixture(part.fixtureDef);
+
+    if (partIndex) partIndex.add(body, carId, part.partDef);
+    return body;
+}
+
+function createJoint(world, blueprint, jointIndex, parent, child, anchorWorld, anchorDef) {
+    const j = blueprint.joints[jointIndex];
+    const joint = planck.RevoluteJoint({ ...j.jointDef, ...anchorDef }, parent, child, anchorWorld);
+
+    // Store break thresholds in userData for simulation step
+    joint.setUserData({
+        breakForce: j.breakForce,
+        breakTorque: j.breakTorque,
+        isBroken: false,
+        jointIndex // Index into blueprint.joints, used by car snapshots
+    });
+
+    world.createJoint(joint);
+    return joint;
+}
+
+export function buildCar(world, dna, position, carId, partIndex = null, blueprint = createCarBlueprint(dna, carId)) {
+    const parts = new Map(); // id -> body
+    const joints = [];
+    const bodies = [];
+
+    // Create Bodies (Parts) in build order, each child centered on its parent's anchor
+    for (const part of blueprint.parts) {
+        const pos = part.parentIndex === -1
+            ? position
+            : bodies[part.parentIndex].getWorldPoint(planck.Vec2(part.anchorX, part.anchorY));
+        const body = createPartBody(world, part, carId, { position: pos, angle: 0 }, partIndex);
+        bodies.push(body);
+        parts.set(part.partDef.id, body);
+    }
+
+    // Create Joints now that all bodies exist
+    // Anchor is local to parent; RevoluteJoint takes it in world space
+    blueprint.joints.forEach((j, jointIndex) => {
+        const parent = parts.get(j.parentId);
+        const child = parts.get(j.childId);
+        const anchorWorld = parent.getWorldPoint(planck.Vec2(j.anchorX, j.anchorY));
+        joints.push(createJoint(world, blueprint, jointIndex, parent, child, anchorWorld));
+    });
+
+    return { parts, joints };
+}
+
+/**
+ * Re-create a culled car from its snapshot: the parts and joints that existed when it
+ * was culled, with their poses and velocities (see carSnapshot.js)
+ * @param {Object} world - Planck world
+ * @param {Object} blueprint - From createCarBlueprint() for the same DNA (and sprites)
+ * @param {CarSnapshot} snapshot - Captured state
+ * @param {number} carId - Car id stored on the restored bodies
+ * @param {Object} placement - { dx, dy, velocityScale } applied to every body (coasting while culled)
+ * @param {PartIndex} partIndex - Optional body index to register parts in
+ * @returns {Object} { parts, joints }
+ */
+export function restoreCar(world, blueprint, snapshot, carId, { dx = 0, dy = 0, velocityScale = 1 } = {}, partIndex = null) {
+    const parts = new Map();
+    const joints = [];
+    const { bodies, jointAnchors } = snapshot;
+
+    for (let i = 0; i < snapshot.bodyCount; i++) {
+        const part = blueprint.partsById.get(snapshot.partIds[i]);
+        const base = i * BODY_STRIDE;
+        const body = createPartBody(world, part, carId, {
+            position: planck.Vec2(bodies[base + B_X] + dx, bodies[base + B_Y] + dy),
+            angle: bodies[base + B_ANGLE],
+            linearVelocity: planck.Vec2(bodies[base + B_VX] * velocityScale, bodies[base + B_VY] * velocityScale),
+            angularVelocity: bodies[base + B_W] * velocityScale
+        }, partIndex);
+        parts.set(part.partDef.id, body);
+    }
+
+    // Joints keep their original local anchors and reference angle, so limits line up exactly
+    for (let k = 0; k < snapshot.jointCount; k++) {
+        const jointIndex = snapshot.jointIndices[k];
+        const j = blueprint.joints[jointIndex];
+        const base = k * JOINT_STRIDE;
+        joints.push(createJoint(world, blueprint, jointIndex, parts.get(j.parentId), parts.get(j.childId), undefined, {
+            localAnchorA: planck.Vec2(jointAnchors[base + J_LOCAL_A_X], jointAnchors[base + J_LOCAL_A_Y]),
+            localAnchorB: planck.Vec2(jointAnchors[base + J_LOCAL_B_X], jointAnchors[base + J_LOCAL_B_Y]),
+            referenceAngle: jointAnchors[base + J_REFERENCE_ANGLE]
+        }));
+    }
+
     return { parts, joints };
 }
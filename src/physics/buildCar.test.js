@@ -1,6 +1,6 @@
 import { describe, it, expect, beforeEach } from 'vitest';
 import * as planck from 'planck-js';
-import { buildCar } from './buildCar.js';
+import { buildCar, getBlueprintKey } from './buildCar.js';
 
 describe('buildCar', () => {
   let world;
@@ -119,4 +119,18 @@ describe('buildCar', () => {
     // Then the fixture should have a Polygon shape (Box)
     expect(fixture.getShape().getType()).toBe('polygon');
   });
+
+  // B-20261017-190000: Given an elite moved to a new car index, When its blueprint key is computed, Then it matches the key from its old index
+  it('blueprint keys follow the DNA and sprites, not the car index', () => {
+    const dna = {
+      parts: [
+        { id: 0, kind: 'block', w: 1, h: 0.5, density: 1, friction: 0.3 },
+        { id: 1, kind: 'wheel', radius: 0.4, density: 1, friction: 0.9, motorSpeed: -10, maxMotorTorque: 50 }
+      ],
+      joints: []
+    };
+
+    expect(getBlueprintKey(dna, 17, 'hash')).toBe(getBlueprintKey(dna, 0, 'hash'));
+    expect(getBlueprintKey(dna, 0, 'other')).not.toBe(getBlueprintKey(dna, 0, 'hash'));
+  });
 });
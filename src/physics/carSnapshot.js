@@ -0,0 +1,111 @@
+/**
+ * Car Snapshot
+ * Compact typed-array record of a car's physical state: every remaining body's
+ * transform and velocities, and the joints that have not broken. Culled cars are
+ * parked as a snapshot and restored from it with restoreCar() (buildCar.js),
+ * so they come back exactly as they left instead of being rebuilt at rest.
+ */
+
+// Body record (Float64Array, BODY_STRIDE per body)
+export const BODY_STRIDE = 6;
+export const B_X = 0;
+export const B_Y = 1;
+export const B_ANGLE = 2;
+export const B_VX = 3;
+export const B_VY = 4;
+export const B_W = 5;
+
+// Joint record (Float64Array, JOINT_STRIDE per surviving joint)
+export const JOINT_STRIDE = 5;
+export const J_LOCAL_A_X = 0;
+export const J_LOCAL_A_Y = 1;
+export const J_LOCAL_B_X = 2;
+export const J_LOCAL_B_Y = 3;
+export const J_REFERENCE_ANGLE = 4;
+
+const INITIAL_CAPACITY = 16;
+
+export class CarSnapshot {
+    constructor(capacity = INITIAL_CAPACITY) {
+        this.bodyCount = 0;
+        this.jointCount = 0;
+        this.originX = 0; // Chassis position at capture
+        this.originY = 0;
+        this.originVX = 0;
+        this._allocate(capacity);
+    }
+
+    _allocate(capacity) {
+        this.capacity = capacity;
+        this.partIds = new Int16Array(capacity);
+        this.bodies = new Float64Array(capacity * BODY_STRIDE);
+        this.jointIndices = new Int16Array(capacity); // Index into blueprint.joints
+        this.jointAnchors = new Float64Array(capacity * JOINT_STRIDE);
+    }
+
+    /**
+     * Record the car's current bodies and surviving joints
+     * @param {Object} car - { parts: Map<partId, body>, joints: [] }
+     * @returns {CarSnapshot} this
+     */
+    capture(car) {
+        const needed = Math.max(car.parts.size, car.joints.length);
+        if (needed > this.capacity) {
+            this._allocate(Math.max(needed, this.capacity * 2));
+        }
+
+        this.bodyCount = 0;
+        for (const [partId, body] of car.parts) {
+            const i = this.bodyCount++;
+            const base = i * BODY_STRIDE;
+            const pos = body.getPosition();
+            const vel = body.getLinearVelocity();
+            this.partIds[i] = partId;
+            this.bodies[base + B_X] = pos.x;
+            this.bodies[base + B_Y] = pos.y;
+            this.bodies[base + B_ANGLE] = body.getAngle();
+            this.bodies[base + B_VX] = vel.x;
+            this.bodies[base + B_VY] = vel.y;
+            this.bodies[base + B_W] = body.getAngularVelocity();
+        }
+
+        this.jointCount = 0;
+        for (const joint of car.joints) {
+            const k = this.jointCount++;
+            const base = k * JOINT_STRIDE;
+            const anchorA = joint.getLocalAnchorA();
+            const anchorB = joint.getLocalAnchorB();
+            this.jointIndices[k] = joint.getUserData().jointIndex;
+            this.jointAnchors[base + J_LOCAL_A_X] = anchorA.x;
+            this.jointAnchors[base + J_LOCAL_A_Y] = anchorA.y;
+            this.jointAnchors[base + J_LOCAL_B_X] = anchorB.x;
+            this.jointAnchors[base + J_LOCAL_B_Y] = anchorB.y;
+            this.jointAnchors[base + J_REFERENCE_ANGLE] = joint.getReferenceAngle();
+        }
+
+        const chassis = car.parts.get(0);
+        if (chassis) {
+            this.originX = chassis.getPosition().x;
+            this.originY = chassis.getPosition().y;
+            this.originVX = chassis.getLinearVelocity().x;
+        }
+        return this;
+    }
+}
+
+/**
+ * Free list of snapshots so culling does not allocate once warmed up
+ */
+export class SnapshotPool {
+    constructor() {
+        this.free = [];
+    }
+
+    acquire() {
+        return this.free.pop() || new CarSnapshot();
+    }
+
+    release(snapshot) {
+        this.free.push(snapshot);
+    }
+}
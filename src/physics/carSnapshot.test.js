@@ -0,0 +1,63 @@
+import { describe, it, expect } from 'vitest';
+import * as planck from 'planck-js';
+import { buildCar, createCarBlueprint, restoreCar } from './buildCar.js';
+import { CarSnapshot, SnapshotPool } from './carSnapshot.js';
+
+const dna = {
+    parts: [
+        { id: 0, kind: 'block', w: 1, h: 0.5, density: 1, friction: 0.3 },
+        { id: 1, kind: 'wheel', radius: 0.4, density: 1, friction: 0.9, motorSpeed: -10, maxMotorTorque: 50 },
+        { id: 2, kind: 'wheel', radius: 0.4, density: 1, friction: 0.9, motorSpeed: -10, maxMotorTorque: 50 }
+    ],
+    joints: [
+        { childId: 1, parentId: 0, anchorX: 0.5, anchorY: -0.25, jointType: 'revolute', enableLimit: false, lowerAngle: 0, upperAngle: 0, breakForce: 1000, breakTorque: 1000 },
+        { childId: 2, parentId: 0, anchorX: -0.5, anchorY: -0.25, jointType: 'revolute', enableLimit: true, lowerAngle: -0.5, upperAngle: 0.5, breakForce: 1000, breakTorque: 1000 }
+    ]
+};
+
+function createMovingCar() {
+    const world = planck.World({ gravity: planck.Vec2(0, -10) });
+    const blueprint = createCarBlueprint(dna, 0);
+    const { parts, joints } = buildCar(world, dna, planck.Vec2(0, 5), 0, null, blueprint);
+    parts.get(0).setAngularVelocity(2);
+    for (let i = 0; i < 30; i++) world.step(1 / 60);
+    return { world, blueprint, car: { parts, joints } };
+}
+
+describe('carSnapshot.js', () => {
+    // B-20261017-180000: Given a moving car, When it is captured, destroyed and restored, Then every body has the same pose and velocities
+    it('restores bodies exactly from a snapshot', () => {
+        const { world, blueprint, car } = createMovingCar();
+        const snapshot = new CarSnapshot().capture(car);
+        const before = [...car.parts.values()].map(b => ({
+            x: b.getPosition().x, y: b.getPosition().y, angle: b.getAngle(),
+            vx: b.getLinearVelocity().x, vy: b.getLinearVelocity().y, w: b.getAngularVelocity()
+        }));
+        car.parts.forEach(b => world.destroyBody(b));
+
+        const restored = restoreCar(world, blueprint, snapshot, 0);
+        const after = [...restored.parts.values()].map(b => ({
+            x: b.getPosition().x, y: b.getPosition().y, angle: b.getAngle(),
+            vx: b.getLinearVelocity().x, vy: b.getLinearVelocity().y, w: b.getAngularVelocity()
+        }));
+
+        expect(after).toEqual(before);
+        expect(restored.joints[1].getReferenceAngle()).toBe(car.joints[1].getReferenceAngle());
+        expect(restored.joints[1].getLowerLimit()).toBe(-0.5);
+    });
+
+    // B-20261017-180001: Given a car with a broken joint, When it is restored from a snapshot, Then the broken joint stays broken
+    it('restores only the joints that survived', () => {
+        const { world, blueprint, car } = createMovingCar();
+        world.destroyJoint(car.joints[0]);
+        car.joints.splice(0, 1);
+
+        const snapshot = new SnapshotPool().acquire().capture(car);
+        car.parts.forEach(b => world.destroyBody(b));
+        const restored = restoreCar(world, blueprint, snapshot, 0, { dx: 10 });
+
+        expect(restored.joints).toHaveLength(1);
+        expect(restored.joints[0].getBodyB()).toBe(restored.parts.get(2));
+        expect(restored.parts.get(0).getPosition().x).toBeCloseTo(snapshot.originX + 10);
+    });
+});
@@ -0,0 +1,33 @@
+/**
+ * Evaluation Worker
+ * Runs headless simulations for a slice of the population.
+ * Works as a browser module Worker and as a Node.js worker_threads entry.
+ *
+ * Message in:  { jobId, dnas }
+ * Message out: { jobId, fitnesses } or { jobId, error }
+ */
+
+import { evaluate } from './simulate.js';
+
+function handleJob({ jobId, dnas }) {
+    try {
+        return { jobId, fitnesses: dnas.map(dna => evaluate(dna)) };
+    } catch (error) {
+        return { jobId, error: error.message };
+    }
+}
+
+const isBrowserWorker = typeof WorkerGlobalScope !== 'undefined' && typeof self !== 'undefined';
+
+if (isBrowserWorker) {
+    self.onmessage = (event) => {
+        self.postMessage(handleJob(event.data));
+    };
+} else {
+    const { parentPort } = await import('node:worker_threads');
+    if (parentPort) {
+        parentPort.on('message', (message) => {
+            parentPort.postMessage(handleJob(message));
+        });
+    }
+}
@@ -0,0 +1,177 @@
+/**
+ * Evaluation Pool
+ * Splits a generation's DNAs across a pool of workers and returns
+ * { dna, fitness } results in population order, ready for nextGeneration().
+ * Uses Web Workers in the browser and worker_threads in Node.js.
+ * Falls back to evaluating on the current thread when no workers are available,
+ * and drops workers that crash so later generations never wait on them.
+ */
+
+import { evaluatePopulation } from './simulate.js';
+
+// Detect if we're running in Node.js or browser
+const isNode = typeof process !== 'undefined' && process.versions != null && process.versions.node != null;
+
+// Each worker pulls several small chunks so cars that die early don't leave cores idle
+const CHUNKS_PER_WORKER = 4;
+
+export class EvaluationPool {
+    /**
+     * @param {Function|null} createWorker - (onMessage, onError) => { postMessage, terminate }
+     * @param {number} size - Number of workers to spawn (0 = evaluate on the current thread)
+     */
+    constructor(createWorker, size = 0) {
+        this.workers = [];
+        this.jobs = new Map(); // jobId -> { worker, resolve, reject }
+        this.nextJobId = 0;
+        this.crashed = new WeakSet();
+
+        for (let i = 0; i < size; i++) {
+            const worker = createWorker(
+                (message) => this._onMessage(message),
+                (error) => this._onError(worker, error)
+            );
+            this.workers.push(worker);
+        }
+    }
+
+    get size() {
+        return this.workers.length;
+    }
+
+    _onMessage({ jobId, fitnesses, error }) {
+        const job = this.jobs.get(jobId);
+        if (!job) return;
+        this.jobs.delete(jobId);
+
+        if (error) {
+            job.reject(new Error(error));
+        } else {
+            job.resolve(fitnesses);
+        }
+    }
+
+    _onError(worker, error) {
+        // Take the crashed worker out of the pool and fail the job it was running
+        const index = this.workers.indexOf(worker);
+        if (index !== -1) {
+            this.workers.splice(index, 1);
+            this.crashed.add(worker);
+            worker.terminate();
+        }
+        for (const [jobId, job] of this.jobs) {
+            if (job.worker !== worker) continue;
+            this.jobs.delete(jobId);
+            job.reject(error);
+        }
+    }
+
+    _runJob(worker, dnas) {
+        const jobId = this.nextJobId++;
+        return new Promise((resolve, reject) => {
+            this.jobs.set(jobId, { worker, resolve, reject });
+            worker.postMessage({ jobId, dnas });
+        });
+    }
+
+    /**
+     * Evaluate a whole generation
+     * @param {Array} dnas - Population DNAs
+     * @returns {Promise<Array>} [{ dna, fitness }] in population order
+     */
+    async evaluate(dnas) {
+        if (this.workers.length === 0) {
+            return evaluatePopulation(dnas);
+        }
+
+        const fitnesses = new Array(dnas.length);
+        const chunkSize = Math.max(1, Math.ceil(dnas.length / (this.workers.length * CHUNKS_PER_WORKER)));
+        let nextIndex = 0;
+
+        // Each worker takes the next chunk as soon as its current one returns
+        const drain = async (worker) => {
+            while (nextIndex < dnas.length) {
+                const start = nextIndex;
+                const end = Math.min(start + chunkSize, dnas.length);
+                nextIndex = end;
+
+                const chunkDNAs = dnas.slice(start, end);
+                let chunk;
+                try {
+                    chunk = await this._runJob(worker, chunkDNAs);
+                } catch (error) {
+                    if (!this.crashed.has(worker)) throw error;
+                    // Worker died mid-chunk: finish the chunk here and stop using it
+                    chunk = evaluatePopulation(chunkDNAs).map(r => r.fitness);
+                }
+                for (let i = 0; i < chunk.length; i++) {
+                    fitnesses[start + i] = chunk[i];
+                }
+                if (this.crashed.has(worker)) return;
+            }
+        };
+
+        await Promise.all(this.workers.map(drain));
+
+        // If every worker crashed, the chunks nobody pulled are still unset: finish them here
+        const missing = [];
+        for (let i = 0; i < dnas.length; i++) {
+            if (fitnesses[i] === undefined) missing.push(i);
+        }
+        if (missing.length > 0) {
+            const results = evaluatePopulation(missing.map(i => dnas[i]));
+            missing.forEach((index, k) => { fitnesses[index] = results[k].fitness; });
+        }
+
+        return dnas.map((dna, i) => ({ dna, fitness: fitnesses[i] }));
+    }
+
+    terminate() {
+        this.workers.forEach(worker => worker.terminate());
+        this.workers = [];
+        for (const job of this.jobs.values()) {
+            job.reject(new Error('Evaluation pool terminated'));
+        }
+        this.jobs.clear();
+    }
+}
+
+/**
+ * Create an evaluation pool sized to the available cores
+ * @param {Object} options
+ * @param {number} [options.size] - Worker count (defaults to core count)
+ * @param {Function} [options.createWorker] - Custom worker factory (used by tests)
+ * @returns {Promise<EvaluationPool>}
+ */
+export async function createEvaluationPool({ size, createWorker } = {}) {
+    if (createWorker) {
+        return new EvaluationPool(createWorker, size ?? 1);
+    }
+
+    if (isNode) {
+        // Node.js environment (headless runs)
+        const { Worker } = await import('node:worker_threads');
+        const os = await import('node:os');
+        const poolSize = size ?? os.availableParallelism();
+
+        return new EvaluationPool((onMessage, onError) => {
+            const worker = new Worker(new URL('./evaluateWorker.js', import.meta.url));
+            worker.on('message', onMessage);
+            worker.on('error', onError);
+            return worker;
+        }, poolSize);
+    }
+
+    if (typeof Worker === 'undefined') {
+        return new EvaluationPool(null, 0);
+    }
+
+    // Browser environment: leave one core for the UI thread
+    const poolSize = size ?? Math.max(1, (navigator.hardwareConcurrency || 2) - 1);
+    return new EvaluationPool((onMessage, onError) => {
+        const worker = new Worker(new URL('./evaluateWorker.js', import.meta.url), { type: 'module' });
+        worker.onmessage = (event) => onMessage(event.data);
+        worker.onerror = onError;
+        return worker;
+    }, poolSize);
+}
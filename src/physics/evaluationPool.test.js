@@ -0,0 +1,81 @@
+import { describe, it, expect } from 'vitest';
+import { EvaluationPool, createEvaluationPool } from './evaluationPool.js';
+import { createRandomDNA } from '../ga/dna.js';
+
+// Fake worker: replies with each DNA's marker as its fitness, after a random delay
+function createFakeWorker(onMessage) {
+    return {
+        postMessage({ jobId, dnas }) {
+            setTimeout(() => {
+                onMessage({ jobId, fitnesses: dnas.map(d => d.marker) });
+            }, Math.random() * 5);
+        },
+        terminate() {}
+    };
+}
+
+// Fake worker that crashes on its first job
+function createCrashingWorker(onMessage, onError) {
+    return {
+        postMessage() {
+            setTimeout(() => onError(new Error('worker crashed')), 0);
+        },
+        terminate() {}
+    };
+}
+
+describe('evaluationPool.js', () => {
+    // B-20261017-090000: Given workers that reply out of order, When a generation is evaluated, Then results come back in population order
+    it('returns results in population order across workers', async () => {
+        const pool = new EvaluationPool(createFakeWorker, 3);
+        const dnas = Array.from({ length: 25 }, (_, i) => ({ marker: i }));
+
+        const results = await pool.evaluate(dnas);
+
+        expect(results.map(r => r.fitness)).toEqual(dnas.map(d => d.marker));
+        expect(results[7].dna).toBe(dnas[7]);
+        pool.terminate();
+    });
+
+    // B-20261017-090001: Given a pool without workers, When a generation is evaluated, Then it simulates on the current thread
+    it('falls back to the current thread with zero workers', async () => {
+        const pool = await createEvaluationPool({ size: 0, createWorker: createFakeWorker });
+        const dnas = [createRandomDNA(3), createRandomDNA(3)];
+
+        const results = await pool.evaluate(dnas);
+
+        expect(results).toHaveLength(2);
+        expect(results.every(r => r.fitness >= 0)).toBe(true);
+    });
+
+    // B-20261017-200101: Given a worker that crashes mid-generation, When generations are evaluated, Then its chunk finishes in-thread and later generations skip it
+    it('drops a crashed worker instead of hanging later generations', async () => {
+        let spawned = 0;
+        const pool = new EvaluationPool(
+            (onMessage, onError) => (spawned++ === 0 ? createCrashingWorker(onMessage, onError) : createFakeWorker(onMessage)),
+            2
+        );
+        const dnas = Array.from({ length: 4 }, (_, i) => ({ ...createRandomDNA(3), marker: i }));
+
+        const first = await pool.evaluate(dnas);
+        const second = await pool.evaluate(dnas);
+
+        expect(first).toHaveLength(4);
+        expect(first.every(r => r.fitness >= 0)).toBe(true);
+        expect(pool.size).toBe(1);
+        expect(second.map(r => r.fitness)).toEqual([0, 1, 2, 3]);
+        pool.terminate();
+    });
+
+    // B-20261017-210000: Given workers that all crash, When a generation is evaluated, Then every DNA still gets a fitness on the current thread
+    it('finishes the whole generation when every worker crashes', async () => {
+        const pool = new EvaluationPool(createCrashingWorker, 2);
+        const dnas = Array.from({ length: 16 }, () => createRandomDNA(3));
+
+        const results = await pool.evaluate(dnas);
+
+        expect(pool.size).toBe(0);
+        expect(results).toHaveLength(16);
+        expect(results.every(r => r.fitness >= 0)).toBe(true);
+    });
+});
@@ -0,0 +1,69 @@
+/**
+ * Part Index
+ * Maps physics bodies to their car and part definition so contact callbacks
+ * and per-step loops avoid scanning every car's DNA.
+ * Populated by buildCar(); kept in sync as bodies are destroyed.
+ */
+
+const NO_JETPACKS = Object.freeze([]);
+
+export class PartIndex {
+    constructor() {
+        this.byBody = new Map(); // body -> entry
+        this.jetpacksByCar = new Map(); // carId -> [entry]
+    }
+
+    /**
+     * Register a freshly built part body
+     * @param {Object} body - planck Body
+     * @param {number} carId - Owning car
+     * @param {Object} partDef - DNA part definition
+     * @returns {Object} The index entry
+     */
+    add(body, carId, partDef) {
+        const entry = {
+            body,
+            carId,
+            partId: partDef.id,
+            partDef,
+            isJetpack: partDef.kind === 'jetpack'
+        };
+        this.byBody.set(body, entry);
+
+        if (entry.isJetpack) {
+            if (!this.jetpacksByCar.has(carId)) this.jetpacksByCar.set(carId, []);
+            this.jetpacksByCar.get(carId).push(entry);
+        }
+        return entry;
+    }
+
+    get(body) {
+        return this.byBody.get(body);
+    }
+
+    isJetpack(body) {
+        const entry = this.byBody.get(body);
+        return !!(entry && entry.isJetpack);
+    }
+
+    getJetpacks(carId) {
+        return this.jetpacksByCar.get(carId) || NO_JETPACKS;
+    }
+
+    removeBody(body) {
+        const entry = this.byBody.get(body);
+        if (!entry) return;
+        this.byBody.delete(body);
+
+        if (entry.isJetpack) {
+            const jetpacks = this.jetpacksByCar.get(entry.carId);
+            const i = jetpacks ? jetpacks.indexOf(entry) : -1;
+            if (i !== -1) jetpacks.splice(i, 1);
+        }
+    }
+
+    clear() {
+        this.byBody.clear();
+        this.jetpacksByCar.clear();
+    }
+}
@@ -0,0 +1,43 @@
+import { describe, it, expect } from 'vitest';
+import * as planck from 'planck-js';
+import { buildCar } from './buildCar.js';
+import { PartIndex } from './partIndex.js';
+
+const dna = {
+    parts: [
+        { id: 0, kind: 'block', w: 1, h: 0.5, density: 1, friction: 0.3 },
+        { id: 1, kind: 'wheel', radius: 0.4, density: 1, friction: 0.9, motorSpeed: -10, maxMotorTorque: 50 },
+        { id: 2, kind: 'jetpack', w: 0.5, h: 0.8, density: 1, friction: 0.5, thrust: 200 }
+    ],
+    joints: [
+        { childId: 1, parentId: 0, anchorX: 0.5, anchorY: -0.25, jointType: 'revolute', enableLimit: false, lowerAngle: 0, upperAngle: 0, breakForce: 1000, breakTorque: 1000 },
+        { childId: 2, parentId: 0, anchorX: -0.5, anchorY: 0.25, jointType: 'revolute', enableLimit: false, lowerAngle: 0, upperAngle: 0, breakForce: 1000, breakTorque: 1000 }
+    ]
+};
+
+describe('partIndex.js', () => {
+    // B-20261017-120000: Given a shared PartIndex, When buildCar() builds a car, Then each body maps to its car, part definition and flags
+    it('buildCar registers bodies with precomputed flags', () => {
+        const world = planck.World({ gravity: planck.Vec2(0, -10) });
+        const index = new PartIndex();
+
+        const { parts } = buildCar(world, dna, planck.Vec2(0, 5), 7, index);
+
+        expect(index.get(parts.get(0))).toMatchObject({ carId: 7, partId: 0, isJetpack: false });
+        expect(index.get(parts.get(1))).toMatchObject({ carId: 7, partId: 1, partDef: dna.parts[1], isJetpack: false });
+        expect(index.isJetpack(parts.get(2))).toBe(true);
+        expect(index.getJetpacks(7).map(e => e.body)).toEqual([parts.get(2)]);
+    });
+
+    // B-20261017-120001: Given an indexed jetpack, When its body is removed, Then it no longer appears in lookups or the car's jetpack list
+    it('removeBody keeps the jetpack list in sync', () => {
+        const world = planck.World({ gravity: planck.Vec2(0, -10) });
+        const index = new PartIndex();
+        const { parts } = buildCar(world, dna, planck.Vec2(0, 5), 3, index);
+
+        index.removeBody(parts.get(2));
+
+        expect(index.isJetpack(parts.get(2))).toBe(false);
+        expect(index.getJetpacks(3)).toHaveLength(0);
+    });
+});
@@ -9,6 +9,8 @@ const MIN_PROGRESS_EPS = 0.05; // meters
 const PROGRESS_TIMEOUT = 3; // seconds
 const AIR_FRICTION_COEFFICIENT = 0.3; // Additional drag force for flying cars
 
+// Each Simulation owns its own world and track, so a car's result depends only on
+// its DNA: the same genome always produces the same fitness (safe to cache).
 export class Simulation {
     constructor(dna) {
         this.world = planck.World({
@@ -91,6 +93,9 @@ export class Simulation {
                 this.maxX = x;
                 this.lastProgressTime = this.time;
             }
+
+            // Stream terrain chunks around the car
+            this.track.update(x, x);
         }
 
         // Check Stop Conditions
@@ -117,3 +122,9 @@ export function evaluate(dna) {
     }
     return sim.getFitness();
 }
+
+export function evaluatePopulation(dnas) {
+    // Headless, in-order evaluation on the current thread.
+    // Returns the { dna, fitness } shape consumed by nextGeneration().
+    return dnas.map(dna => ({ dna, fitness: evaluate(dna) }));
+}
@@ -43,35 +43,139 @@ export function getTrackHeight(x) {
     return Math.max(0, Math.min(terrain, maxHeight));
 }
 
-export function createTrack(world) {
-    const ground = world.createBody({
-        type: 'static',
-        position: planck.Vec2(0, 0),
-    });
-
-    // Sample the track - create very long terrain that extends indefinitely
-    const step = 1.0;
-    const length = 10000; // Extended far enough for long gameplay sessions
-    const points = [];
-
-    // Starting Wall
-    points.push(planck.Vec2(-10, 10));
-    points.push(planck.Vec2(-10, 0));
-
-    for (let x = -5; x < length; x += step) {
-        points.push(planck.Vec2(x, getTrackHeight(x)));
+// Terrain sampling: heights at 1 m steps starting at the foot of the start wall
+export const TRACK_START_X = -5;
+export const TRACK_STEP = 1.0;
+const PRECOMPUTED_LENGTH = 10000; // Samples computed up front; grows on demand beyond this
+
+// Streaming: chain fixtures exist only around the cars
+const CHUNK_SIZE = 100; // Samples (metres) per chain fixture
+const CHUNKS_AHEAD = 2; // Chunks kept ahead of the leader's chunk
+const DROP_DISTANCE = 50; // Metres behind the last active car before chunks are dropped
+
+const GROUND_FRICTION = 0.8;
+
+// Shared across generations and worlds
+let heightSamples = new Float64Array(0);
+
+/**
+ * Get precomputed track heights (sample i is at x = TRACK_START_X + i * TRACK_STEP)
+ * @param {number} count - Minimum number of samples needed
+ * @returns {Float64Array} Shared sample array (may hold more than count samples)
+ */
+export function getTrackSamples(count = PRECOMPUTED_LENGTH) {
+    if (heightSamples.length < count) {
+        const grown = new Float64Array(Math.max(count, heightSamples.length * 2));
+        grown.set(heightSamples);
+        for (let i = heightSamples.length; i < grown.length; i++) {
+            grown[i] = getTrackHeight(TRACK_START_X + i * TRACK_STEP);
+        }
+        heightSamples = grown;
+    }
+    return heightSamples;
+}
+
+export class StreamingTrack {
+    constructor(world, { chunkSize = CHUNK_SIZE, chunksAhead = CHUNKS_AHEAD, dropDistance = DROP_DISTANCE } = {}) {
+        this.world = world;
+        this.chunkSize = chunkSize;
+        this.chunksAhead = chunksAhead;
+        this.dropDistance = dropDistance;
+        this.chunks = new Map(); // chunk index -> fixture
+
+        this.body = world.createBody({
+            type: 'static',
+            position: planck.Vec2(0, 0),
+        });
+
+        // Starting Wall (permanent)
+        const wallShape = planck.Chain([
+            planck.Vec2(-10, 10),
+            planck.Vec2(-10, 0),
+            planck.Vec2(TRACK_START_X, getTrackSamples()[0])
+        ], false);
+        this._addFixture(wallShape);
+
+        this.update(0, 0);
+    }
+
+    getChunkIndex(x) {
+        return Math.max(0, Math.floor((x - TRACK_START_X) / (this.chunkSize * TRACK_STEP)));
+    }
+
+    /**
+     * Materialise chunks up to the leader and drop chunks behind the trailing car
+     * @param {number} leaderX - Furthest car position
+     * @param {number} trailingX - Position of the last car that can still touch the ground
+     */
+    update(leaderX, trailingX) {
+        if (!Number.isFinite(leaderX) || !Number.isFinite(trailingX)) return;
+
+        const first = this.getChunkIndex(Math.min(leaderX, trailingX) - this.dropDistance);
+        const last = this.getChunkIndex(leaderX) + this.chunksAhead;
+
+        for (const [index, fixture] of this.chunks) {
+            if (index < first) {
+                this.body.destroyFixture(fixture);
+                this.chunks.delete(index);
+            }
+        }
+
+        for (let index = first; index <= last; index++) {
+            if (!this.chunks.has(index)) {
+                this._createChunk(index);
+            }
+        }
     }
 
-    // Create chain shape
-    // Planck ChainShape takes array of Vec2
-    const shape = planck.Chain(points, false);
+    /**
+     * Return to the start window for a new generation, keeping chunks that are still needed
+     */
+    reset() {
+        const last = this.getChunkIndex(0) + this.chunksAhead;
+        for (const [index, fixture] of this.chunks) {
+            if (index > last) {
+                this.body.destroyFixture(fixture);
+                this.chunks.delete(index);
+            }
+        }
+        this.update(0, 0);
+    }
+
+    _createChunk(index) {
+        const startSample = index * this.chunkSize;
+        const endSample = startSample + this.chunkSize; // Shared with the next chunk
+        const samples = getTrackSamples(endSample + 2);
+
+        const points = [];
+        for (let i = startSample; i <= endSample; i++) {
+            points.push(planck.Vec2(TRACK_START_X + i * TRACK_STEP, samples[i]));
+        }
 
-    ground.createFixture({
-        shape: shape,
-        friction: 0.8,
-        friction: 0.8
-        // filterGroupIndex: -1 // REMOVED: Caused collision failure with cars (which are also -1)
-    });
+        const shape = planck.Chain(points, false);
+
+        // Ghost vertices let wheels roll smoothly across chunk seams. planck-js only
+        // exposes them through these underscored setters, so its version is pinned
+        // and track.test.js checks they still take effect.
+        const prev = startSample > 0
+            ? planck.Vec2(TRACK_START_X + (startSample - 1) * TRACK_STEP, samples[startSample - 1])
+            : planck.Vec2(-10, 0);
+        shape._setPrevVertex(prev);
+        shape._setNextVertex(planck.Vec2(TRACK_START_X + (endSample + 1) * TRACK_STEP, samples[endSample + 1]));
+
+        this.chunks.set(index, this._addFixture(shape));
+    }
+
+    _addFixture(shape) {
+        return this.body.createFixture({
+            shape: shape,
+            friction: GROUND_FRICTION
+            // filterGroupIndex: -1 // REMOVED: Caused collision failure with cars (which are also -1)
+        });
+    }
+}
 
-    return ground;
+export function createTrack(world, options) {
+    // Only a few chunks exist at a time; call track.update() as cars advance
+    return new StreamingTrack(world, options);
 }
@@ -1,5 +1,6 @@
 import { describe, it, expect } from 'vitest';
-import { getTrackHeight } from './track.js';
+import * as planck from 'planck-js';
+import { getTrackHeight, getTrackSamples, createTrack, TRACK_START_X } from './track.js';
 
 describe('track.js', () => {
     // B-17: Given x < 0, When getTrackHeight(x) is called, Then it returns 4 (wall height)
@@ -18,4 +19,56 @@ describe('track.js', () => {
         const height2 = getTrackHeight(50);
         expect(height1).toBe(height2);
     });
+
+    // B-20261017-110000: Given the shared sample array, When a sample is read, Then it equals getTrackHeight at that x
+    it('getTrackSamples precomputes heights at 1m steps from the wall', () => {
+        const samples = getTrackSamples();
+        expect(samples.length).toBeGreaterThanOrEqual(10000);
+        expect(samples[0]).toBe(getTrackHeight(-5));
+        expect(samples[155]).toBe(getTrackHeight(150));
+        expect(getTrackSamples()).toBe(samples);
+    });
+
+    // B-20261017-110001: Given a streaming track, When the cars move far ahead, Then chunks behind are dropped and chunks ahead exist
+    it('streams chunks ahead of the leader and drops chunks behind', () => {
+        const world = planck.World({ gravity: planck.Vec2(0, -9.8) });
+        const track = createTrack(world);
+        const startChunks = track.chunks.size;
+
+        track.update(1000, 900);
+
+        expect(track.chunks.has(0)).toBe(false);
+        expect(track.chunks.has(track.getChunkIndex(1000) + 1)).toBe(true);
+        expect(track.chunks.size).toBeLessThan(10);
+        expect(startChunks).toBeLessThan(10);
+    });
+
+    // B-20261017-180002: Given a track streamed far ahead, When it is reset for a new generation, Then only the start window remains
+    it('reset returns the track to the start window', () => {
+        const world = planck.World({ gravity: planck.Vec2(0, -9.8) });
+        const track = createTrack(world);
+        const startChunks = [...track.chunks.keys()];
+
+        track.update(1000, 900);
+        track.reset();
+
+        expect([...track.chunks.keys()].sort((a, b) => a - b)).toEqual(startChunks);
+    });
+
+    // B-20261017-200300: Given two adjacent chunks, When they are created, Then each chain's ghost vertices are its neighbour's edge samples
+    it('links chunk seams with ghost vertices', () => {
+        const world = planck.World({ gravity: planck.Vec2(0, -9.8) });
+        const track = createTrack(world);
+        const samples = getTrackSamples();
+        const shape = track.chunks.get(1).getShape();
+        const start = track.chunkSize;
+        const end = start + track.chunkSize;
+
+        expect(shape.m_hasPrevVertex).toBe(true);
+        expect(shape.m_hasNextVertex).toBe(true);
+        expect(shape.m_prevVertex.x).toBe(TRACK_START_X + start - 1);
+        expect(shape.m_prevVertex.y).toBe(samples[start - 1]);
+        expect(shape.m_nextVertex.x).toBe(TRACK_START_X + end + 1);
+        expect(shape.m_nextVertex.y).toBe(samples[end + 1]);
+    });
 });
@@ -1,30 +1,10 @@
 
 import { PI } from '../ga/dna.js';
-import * as planck from 'planck-js';
-import { getTrackHeight } from '../physics/track.js';
+import { getTrackHeight, getTrackSamples, TRACK_START_X, TRACK_STEP } from '../physics/track.js';
 import * as partRegistry from '../partRegistry.js';
 
 const SCALE = 20; // pixels per meter
 
-const visualAssets = {};
-const ASSET_LIST = [
-    'geo_body_sport', 'geo_body_truck', 'geo_wheel_mag',
-    'cyber_engine_reactor', 'cyber_engine_v8cyber', 'cyber_engine_turbine',
-    'cyber_booster_rocket'
-];
-
-function loadAssets() {
-    if (typeof Image === 'undefined') {
-        return;
-    }
-    ASSET_LIST.forEach(name => {
-        const img = new Image();
-        img.src = `/art/${name}.png`;
-        visualAssets[name] = img;
-    });
-}
-loadAssets();
-
 // Delegate to partRegistry for styles and scales
 export function getPartRenderStyle(partKind = 'block') {
     return partRegistry.getPartVisualStyle(partKind);
@@ -34,7 +14,35 @@ export function getWheelDetailScale(partKind = 'wheel') {
     return partRegistry.getWheelDetailScale(partKind);
 }
 
-export function render(ctx, world, cameraX, width, height, championId, miniMapData) {
+// Ground tiles: fixed runs of terrain samples cached as world-space paths
+const GROUND_TILE_SAMPLES = 50;
+const GROUND_DEEP_Y = -100;
+const GROUND_COLOR = '#2f483a';
+const groundTiles = new Map(); // tile index -> Path2D, only tiles in the camera window
+let wallPath = null;
+
+// Per-part static detail (style, dimensions, outline), computed on first draw
+const partDetails = new WeakMap(); // body -> detail
+
+// Mini-map layer, redrawn only when what it shows changes
+const MINI_MAP_HEIGHT = 30;
+const MINI_MAP_MARGIN = 15;
+const MINI_MAP_OVERHANG = 16; // Room above the bar for the record label, flag and tracked-car arrow
+const miniMapLayer = { canvas: null, ctx: null, key: NaN };
+
+const hasPath2D = typeof Path2D !== 'undefined';
+
+/**
+ * Render one frame
+ * Terrain is drawn from the shared height samples, not from the physics world.
+ * @param {CanvasRenderingContext2D} ctx
+ * @param {number} cameraX - Camera x in metres
+ * @param {number} width - Canvas width
+ * @param {number} height - Canvas height
+ * @param {Object} miniMapData - { cars, historicalMaxX, trackedCarId, nextMilestone }
+ * @param {Map|Array} championBodies - The champion's bodies (car.parts); nothing is drawn if omitted
+ */
+export function render(ctx, cameraX, width, height, miniMapData, championBodies) {
     // Draw Sky - LCD Green
     ctx.fillStyle = '#c4f0c2';
     ctx.fillRect(0, 0, width, height);
@@ -47,22 +55,18 @@ export function render(ctx, world, cameraX, width, height, championId, miniMapDa
 
     ctx.lineWidth = 2 / SCALE;
 
-    // Render Ground (Static Bodies) first
-    for (let b = world.getBodyList(); b; b = b.getNext()) {
-        if (b.getType() === 'static') {
-            renderBody(ctx, b, true);
-        }
-    }
+    // Visible world x-range; only ground tiles inside it are drawn
+    const view = {
+        minX: cameraX - (width / 4) / SCALE,
+        maxX: cameraX + (width * 3 / 4) / SCALE
+    };
 
-    // Render Cars (Dynamic Bodies)
-    // Only render champion's parts if championId is provided
-    for (let b = world.getBodyList(); b; b = b.getNext()) {
-        if (b.getType() !== 'static') {
-            const userData = b.getUserData();
-            if (userData && userData.carId === championId) {
-                renderBody(ctx, b, false);
-            }
-        }
+    // Render Ground first
+    renderGround(ctx, view);
+
+    // Render the champion's parts from its own body list
+    if (championBodies) {
+        championBodies.forEach(body => renderPart(ctx, body));
     }
 
     ctx.restore();
@@ -73,36 +77,172 @@ export function render(ctx, world, cameraX, width, height, championId, miniMapDa
     }
 }
 
-function renderBody(ctx, body, isStatic) {
+/**
+ * Indices of the ground tiles overlapping a world x-range
+ * @returns {{ first: number, last: number }}
+ */
+export function getGroundTileRange(minX, maxX) {
+    const tileWidth = GROUND_TILE_SAMPLES * TRACK_STEP;
+    return {
+        first: Math.max(0, Math.floor((minX - TRACK_START_X) / tileWidth)),
+        last: Math.max(0, Math.floor((maxX - TRACK_START_X) / tileWidth))
+    };
+}
+
+function traceGroundTile(path, index) {
+    const start = index * GROUND_TILE_SAMPLES;
+    const end = start + GROUND_TILE_SAMPLES; // Shared with the next tile so edges meet
+    const samples = getTrackSamples(end + 1);
+    const firstX = TRACK_START_X + start * TRACK_STEP;
+    const lastX = TRACK_START_X + end * TRACK_STEP;
+
+    path.moveTo(firstX, samples[start]);
+    for (let i = start + 1; i <= end; i++) {
+        path.lineTo(TRACK_START_X + i * TRACK_STEP, samples[i]);
+    }
+    path.lineTo(lastX, GROUND_DEEP_Y);
+    path.lineTo(firstX, GROUND_DEEP_Y);
+    path.closePath();
+}
+
+function traceWall(path) {
+    // Starting wall in front of the first sample, filled down like the ground
+    path.moveTo(-10, 10);
+    path.lineTo(-10, 0);
+    path.lineTo(TRACK_START_X, getTrackSamples()[0]);
+    path.lineTo(TRACK_START_X, GROUND_DEEP_Y);
+    path.lineTo(-10, GROUND_DEEP_Y);
+    path.closePath();
+}
+
+function drawCachedPath(ctx, getPath, trace) {
+    if (hasPath2D) {
+        const path = getPath();
+        ctx.fill(path);
+        ctx.stroke(path);
+        return;
+    }
+    // No Path2D (e.g. Node tests): trace straight into the context
+    ctx.beginPath();
+    trace(ctx);
+    ctx.fill();
+    ctx.stroke();
+}
+
+function renderGround(ctx, view) {
+    // Ground Rendering - Dark Pixel
+    ctx.fillStyle = GROUND_COLOR;
+    ctx.strokeStyle = GROUND_COLOR;
+
+    if (view.minX < TRACK_START_X) {
+        drawCachedPath(ctx, () => {
+            if (!wallPath) {
+                wallPath = new Path2D();
+                traceWall(wallPath);
+            }
+            return wallPath;
+        }, traceWall);
+    }
+
+    const { first, last } = getGroundTileRange(view.minX, view.maxX);
+    for (let index = first; index <= last; index++) {
+        drawCachedPath(ctx, () => {
+            let path = groundTiles.get(index);
+            if (!path) {
+                path = new Path2D();
+                traceGroundTile(path, index);
+                groundTiles.set(index, path);
+            }
+            return path;
+        }, (target) => traceGroundTile(target, index));
+    }
+
+    // Drop tiles the camera has left behind, as StreamingTrack.update() does for chunks
+    if (groundTiles.size > last - first + 1) {
+        for (const index of groundTiles.keys()) {
+            if (index < first || index > last) groundTiles.delete(index);
+        }
+    }
+}
+
+/**
+ * Static render detail for a car part body, computed once per body
+ * @param {Object} body - Planck body created by buildCar
+ * @returns {Object} { partKind, style, shapeType, radius, width, height, outline, detailRadius }
+ */
+export function getPartDetail(body) {
+    let detail = partDetails.get(body);
+    if (detail) return detail;
+
+    const partKind = body.getUserData()?.partKind;
+    const fixture = body.getFixtureList();
+    const shape = fixture ? fixture.getShape() : null;
+    const shapeType = shape ? shape.getType() : null;
+
+    detail = {
+        partKind,
+        style: getPartRenderStyle(partKind),
+        shapeType,
+        radius: 0,
+        width: 0,
+        height: 0,
+        outline: null,
+        detailRadius: 0
+    };
+
+    if (shapeType === 'circle') {
+        detail.radius = shape.getRadius();
+        detail.width = detail.height = detail.radius * 2;
+        if (partKind && partKind.includes('wheel')) {
+            detail.detailRadius = detail.radius * getWheelDetailScale(partKind);
+        }
+    } else if (shapeType === 'polygon') {
+        const dims = getPolygonDimensions(shape);
+        if (dims) {
+            detail.width = dims.width;
+            detail.height = dims.height;
+        }
+        if (partKind === 'block') {
+            detail.detailRadius = Math.min(detail.width, detail.height) * 0.12;
+        }
+    }
+
+    if (hasPath2D) {
+        detail.outline = new Path2D();
+        traceShapes(detail.outline, body);
+    }
+
+    partDetails.set(body, detail);
+    return detail;
+}
+
+function renderPart(ctx, body) {
     const pos = body.getPosition();
-    const angle = body.getAngle();
-    const userData = body.getUserData();
+    const detail = getPartDetail(body);
+    const { style, partKind } = detail;
 
     ctx.save();
     ctx.translate(pos.x, pos.y);
-    ctx.rotate(angle);
-
-    if (isStatic) {
-        // Ground Rendering - Dark Pixel
-        ctx.fillStyle = '#2f483a';
-        ctx.strokeStyle = '#2f483a';
-        renderShapes(ctx, body); // Keep shapes for ground
+    ctx.rotate(body.getAngle());
+
+    // Car Part Rendering - Distinct styles by part kind
+    ctx.fillStyle = style.fill;
+    ctx.strokeStyle = style.stroke;
+    if (detail.outline) {
+        ctx.fill(detail.outline);
+        ctx.stroke(detail.outline);
     } else {
-        // Car Part Rendering - Distinct styles by part kind
-        const style = getPartRenderStyle(userData?.partKind);
-        ctx.fillStyle = style.fill;
-        ctx.strokeStyle = style.stroke;
         renderShapes(ctx, body);
-        drawPartDetails(ctx, body, userData?.partKind, style);
-        if (userData?.partKind === 'jetpack') {
-            drawJetpackFlame(ctx, style.accent);
-        }
+    }
+
+    drawPartDetails(ctx, detail);
+    if (partKind === 'jetpack') {
+        drawJetpackFlame(ctx, style.accent);
     }
     ctx.restore();
 }
 
 function drawJetpackFlame(ctx, accent) {
-    ctx.save();
     ctx.fillStyle = accent;
     ctx.beginPath();
     ctx.moveTo(-0.7, 0);
@@ -110,64 +250,44 @@ function drawJetpackFlame(ctx, accent) {
     ctx.lineTo(-0.2, -0.25);
     ctx.closePath();
     ctx.fill();
-    ctx.restore();
 }
 
-function drawPartDetails(ctx, body, partKind, style) {
+function drawPartDetails(ctx, detail) {
+    // Runs inside renderPart's save/restore, so styles set here do not leak
+    const { partKind, style } = detail;
     if (!partKind) return;
 
     if (partKind === 'block') {
-        const dims = getPolygonDimensions(body);
-        if (!dims) return;
-        ctx.save();
+        if (!detail.detailRadius) return;
         ctx.fillStyle = style.accent;
         ctx.beginPath();
-        ctx.arc(0, 0, Math.min(dims.width, dims.height) * 0.12, 0, PI * 2);
+        ctx.arc(0, 0, detail.detailRadius, 0, PI * 2);
         ctx.fill();
-        ctx.restore();
         return;
     }
 
     if (partKind === 'long_body') {
-        const dims = getPolygonDimensions(body);
-        if (!dims) return;
-        ctx.save();
+        if (!detail.width) return;
         ctx.strokeStyle = style.accent;
         ctx.lineWidth = 0.06;
         ctx.beginPath();
-        ctx.moveTo(-dims.width * 0.35, 0);
-        ctx.lineTo(dims.width * 0.35, 0);
+        ctx.moveTo(-detail.width * 0.35, 0);
+        ctx.lineTo(detail.width * 0.35, 0);
         ctx.stroke();
-        ctx.restore();
         return;
     }
 
     if (partKind.includes('wheel')) {
-        const radius = getCircleRadius(body);
-        if (!radius) return;
-        ctx.save();
+        if (!detail.detailRadius) return;
         ctx.strokeStyle = style.accent;
         ctx.lineWidth = 0.08;
         ctx.beginPath();
-        ctx.arc(0, 0, radius * getWheelDetailScale(partKind), 0, PI * 2);
+        ctx.arc(0, 0, detail.detailRadius, 0, PI * 2);
         ctx.stroke();
-        ctx.restore();
     }
 }
 
-function getCircleRadius(body) {
-    const fixture = body.getFixtureList();
-    if (!fixture) return null;
-    const shape = fixture.getShape();
-    if (!shape || shape.getType() !== 'circle') return null;
-    return shape.getRadius();
-}
-
-function getPolygonDimensions(body) {
-    const fixture = body.getFixtureList();
-    if (!fixture) return null;
-    const shape = fixture.getShape();
-    if (!shape || shape.getType() !== 'polygon') return null;
+function getPolygonDimensions(shape) {
     const vertices = shape.m_vertices;
     if (!vertices || !vertices.length) return null;
     let minX = vertices[0].x;
@@ -183,134 +303,119 @@ function getPolygonDimensions(body) {
     return { width: maxX - minX, height: maxY - minY };
 }
 
-function renderSprite(ctx, body, userData) {
-    const { partKind, partId, carId } = userData;
-
-    // Deterministic random choice based on carId + partId
-    const seed = (carId || 0) + (partId || 0);
-
-    // Use partRegistry for sprite mapping
-    const spriteName = partRegistry.getSpriteNameForPart(partKind, seed);
-    const img = visualAssets[spriteName];
-
-    // Get dimensions from the first fixture (assuming single shape per body for simplicity)
-    const f = body.getFixtureList();
-    if (f && img && img.complete) {
+function traceShapes(path, body) {
+    for (let f = body.getFixtureList(); f; f = f.getNext()) {
         const shape = f.getShape();
         const type = shape.getType();
 
-        let w, h;
         if (type === 'circle') {
             const r = shape.getRadius();
-            w = r * 2.2; // Slightly larger than physics circle to look good
-            h = r * 2.2;
-        } else {
-            // Polygon/Box. extracting width/height from vertices is hard generic.
-            // But we know we built them as Boxes in buildCar.
-            // Box vertices are locally axis aligned usually?
-            // Let's assume standard box.
-            // Or access userData if we stored w/h? We didn't.
-            // Let's approximate from AABB of shape?
-            // shape.computeAABB(aabb, transform, 0)? No, simpler:
-            // vertices[0] is usually top-right or similar.
-            // buildCar: Box(w/2, h/2).
-            // Let's iterate vertices to find bounding box.
-            if (type === 'polygon') {
-                // Simple AABB of vertices
-                const vertices = shape.m_vertices;
-                let minX = 0, maxX = 0, minY = 0, maxY = 0;
-                if (vertices && vertices.length) {
-                    minX = vertices[0].x; maxX = vertices[0].x;
-                    minY = vertices[0].y; maxY = vertices[0].y;
-                    for (let i = 1; i < vertices.length; i++) {
-                        minX = Math.min(minX, vertices[i].x);
-                        maxX = Math.max(maxX, vertices[i].x);
-                        minY = Math.min(minY, vertices[i].y);
-                        maxY = Math.max(maxY, vertices[i].y);
-                    }
+            const center = shape.getCenter();
+            path.moveTo(center.x + r, center.y);
+            path.arc(center.x, center.y, r, 0, 2 * PI);
+            // Spoke so rotation is visible
+            path.moveTo(center.x, center.y);
+            path.lineTo(center.x + r, center.y);
+        } else if (type === 'polygon') {
+            const vertices = shape.m_vertices;
+            if (vertices && vertices.length) {
+                path.moveTo(vertices[0].x, vertices[0].y);
+                for (let i = 1; i < vertices.length; i++) {
+                    path.lineTo(vertices[i].x, vertices[i].y);
                 }
-                w = (maxX - minX);
-                h = (maxY - minY);
+                path.closePath();
             }
         }
-
-        if (w && h) {
-            // Flip Y for image rendering because we are in physics Y-up 
-            // BUT canvas `scale(SCALE, -SCALE)` flips Y.
-            // So +Y is DOWN in image space if we draw normally?
-            // Wait, we scaled context (SCALE, -SCALE).
-            // So +Y in local coord goes UP on screen.
-            // drawImage(img, 0, 0) draws strictly.
-            // Images are usually "up is up".
-            // If we draw normally, it will be upside down because of -SCALE Y.
-            // So we need to flip Y again for the sprite.
-            ctx.save();
-            ctx.scale(1, -1);
-            // Draw centered
-            // Logic: physics body center is (0,0).
-            // Image center should be at (0,0).
-            ctx.drawImage(img, -w / 2, -h / 2, w, h);
-            ctx.restore();
-            return;
-        }
     }
-
-    // Fallback if no sprite matched or not loaded
-    ctx.fillStyle = '#d9455f';
-    ctx.strokeStyle = '#2f483a';
-    renderShapes(ctx, body);
 }
 
 function renderShapes(ctx, body) {
-    for (let f = body.getFixtureList(); f; f = f.getNext()) {
-        const shape = f.getShape();
-        const type = shape.getType();
+    ctx.beginPath();
+    traceShapes(ctx, body);
+    ctx.fill();
+    ctx.stroke();
+}
 
-        ctx.beginPath();
-        if (type === 'circle') {
-            const r = shape.getRadius();
-            const center = shape.getCenter();
-            ctx.arc(center.x, center.y, r, 0, 2 * PI);
-            ctx.moveTo(center.x, center.y);
-            ctx.lineTo(center.x + r, center.y);
-        } else if (type === 'polygon' || type === 'chain') {
-            const vertices = shape.m_vertices;
-            if (vertices && vertices.length) {
-                ctx.moveTo(vertices[0].x, vertices[0].y);
-                for (let i = 1; i < vertices.length; i++) {
-                    ctx.lineTo(vertices[i].x, vertices[i].y);
-                }
+/**
+ * Fingerprint of everything the mini-map shows, at pixel resolution
+ * Equal keys mean an identical mini-map, so the cached layer can be reused.
+ */
+export function getMiniMapKey(miniMapData, width, height) {
+    const { cars, historicalMaxX, nextMilestone, trackedCarId } = miniMapData;
+    const mapWidth = width - MINI_MAP_MARGIN * 2;
+    const scaleX = mapWidth / Math.max(historicalMaxX, 100);
+
+    // FNV-1a style mix over integers
+    let hash = 2166136261;
+    const mix = (value) => {
+        hash = Math.imul(hash ^ (value | 0), 16777619);
+    };
+    mix(width);
+    mix(height);
+    mix(Math.floor(historicalMaxX));
+    mix(nextMilestone || 0);
+    mix(trackedCarId ?? -1);
+    for (let i = 0; i < cars.length; i++) {
+        const car = cars[i];
+        if (!(car.x > 0)) continue;
+        mix(i);
+        mix(Math.round(car.x * scaleX));
+        mix(car.finished ? 1 : 0);
+    }
+    return hash >>> 0;
+}
 
-                // Close shape
-                if (type === 'chain' && body.getType() === 'static') {
-                    // Ground fill logic
-                    const last = vertices[vertices.length - 1];
-                    const first = vertices[0];
-                    const deepY = -100;
-
-                    ctx.lineTo(last.x, deepY);
-                    ctx.lineTo(first.x, deepY);
-                    ctx.lineTo(first.x, first.y);
-                } else {
-                    ctx.closePath();
-                }
-            }
+function createLayerCanvas(width, height) {
+    if (typeof OffscreenCanvas !== 'undefined') return new OffscreenCanvas(width, height);
+    if (typeof document !== 'undefined') {
+        const canvas = document.createElement('canvas');
+        canvas.width = width;
+        canvas.height = height;
+        return canvas;
+    }
+    return null;
+}
+
+function renderMiniMap(ctx, miniMapData, width, height) {
+    const layerTop = height - MINI_MAP_HEIGHT - MINI_MAP_MARGIN - MINI_MAP_OVERHANG;
+    const layerHeight = height - layerTop;
+    const key = getMiniMapKey(miniMapData, width, height);
+
+    if (miniMapLayer.key !== key) {
+        let layer = miniMapLayer.canvas;
+        if (!layer || layer.width !== width || layer.height !== layerHeight) {
+            layer = createLayerCanvas(width, layerHeight);
+            miniMapLayer.canvas = layer;
+            miniMapLayer.ctx = layer ? layer.getContext('2d') : null;
         }
-        ctx.fill();
-        ctx.stroke();
+
+        if (!miniMapLayer.ctx) {
+            // No offscreen canvas available: draw straight onto the frame
+            drawMiniMap(ctx, miniMapData, width, height);
+            return;
+        }
+
+        const layerCtx = miniMapLayer.ctx;
+        layerCtx.setTransform(1, 0, 0, 1, 0, 0);
+        layerCtx.clearRect(0, 0, width, layerHeight);
+        layerCtx.translate(0, -layerTop);
+        drawMiniMap(layerCtx, miniMapData, width, height);
+        miniMapLayer.key = key;
     }
+
+    ctx.drawImage(miniMapLayer.canvas, 0, layerTop);
 }
 
 /**
  * Renders a mini-map bar at the bottom of the screen.
  * Shows terrain shape, all cars as dots at correct heights, and a flag at the historical max distance.
  */
-function renderMiniMap(ctx, miniMapData, width, height) {
+function drawMiniMap(ctx, miniMapData, width, height) {
     const { cars, historicalMaxX, nextMilestone } = miniMapData;
 
     // Mini-map dimensions and position (bottom of screen, styled like LCD display)
-    const mapHeight = 30; // Slightly taller to show terrain variation
-    const mapMargin = 15;
+    const mapHeight = MINI_MAP_HEIGHT; // Slightly taller to show terrain variation
+    const mapMargin = MINI_MAP_MARGIN;
     const mapWidth = width - mapMargin * 2;
     const mapY = height - mapHeight - mapMargin;
     const mapX = mapMargin;
@@ -1,5 +1,19 @@
-import { describe, it, expect } from 'vitest';
-import { getPartRenderStyle, getWheelDetailScale } from './renderWorld.js';
+import { describe, it, expect, vi } from 'vitest';
+
+// Minimal Path2D so ground tiles and part outlines are cached as they are in the browser
+const path2DCount = vi.hoisted(() => {
+    const count = { value: 0 };
+    globalThis.Path2D = class {
+        constructor() { count.value++; }
+        moveTo() {}
+        lineTo() {}
+        arc() {}
+        closePath() {}
+    };
+    return count;
+});
+
+import { getPartRenderStyle, getWheelDetailScale, render, getPartDetail, getMiniMapKey, getGroundTileRange } from './renderWorld.js';
 import * as partRegistry from '../partRegistry.js';
 
 describe('renderWorld part styles', () => {
@@ -26,3 +40,70 @@ describe('renderWorld part styles', () => {
         expect(renderStyle.fill).toBe(registryStyle.fill);
     });
 });
+
+function createMockCtx() {
+    // Every canvas method is a spy; property writes (fillStyle, ...) are plain sets
+    return new Proxy({}, {
+        get: (target, key) => (key in target ? target[key] : (target[key] = vi.fn()))
+    });
+}
+
+function createWheelBody() {
+    const shape = { getType: () => 'circle', getRadius: () => 0.5, getCenter: () => ({ x: 0, y: 0 }) };
+    const fixture = { getShape: () => shape, getNext: () => null };
+    return {
+        getPosition: () => ({ x: 2, y: 1 }),
+        getAngle: () => 0,
+        getUserData: () => ({ carId: 1, partId: 0, partKind: 'wheel' }),
+        getFixtureList: vi.fn(() => fixture)
+    };
+}
+
+describe('renderWorld pipeline', () => {
+    // B-20261017-170000: Given a champion body list, When a frame is rendered, Then the world body list is never scanned
+    it('draws the champion from its own body list', () => {
+        const ctx = createMockCtx();
+        const body = createWheelBody();
+
+        render(ctx, 0, 800, 600, null, new Map([[0, body]]));
+
+        expect(ctx.rotate).toHaveBeenCalledTimes(1);
+    });
+
+    // B-20261017-170001: Given a part body, When its render detail is requested repeatedly, Then shape data is computed only once
+    it('caches per-part detail on first draw', () => {
+        const body = createWheelBody();
+
+        const detail = getPartDetail(body);
+
+        expect(getPartDetail(body)).toBe(detail);
+        expect(body.getFixtureList).toHaveBeenCalledTimes(1);
+        expect(detail).toMatchObject({ shapeType: 'circle', radius: 0.5, width: 1 });
+        expect(detail.detailRadius).toBeCloseTo(0.5 * getWheelDetailScale('wheel'));
+    });
+
+    // B-20261017-170002: Given unchanged mini-map content, When the key is recomputed, Then it only changes once a dot moves by a pixel
+    it('keys the mini-map layer on pixel-level content', () => {
+        const data = (x) => ({ cars: [{ id: 0, x, finished: false }], historicalMaxX: 100, trackedCarId: 0, nextMilestone: 50 });
+
+        expect(getMiniMapKey(data(40), 800, 600)).toBe(getMiniMapKey(data(40.01), 800, 600));
+        expect(getMiniMapKey(data(45), 800, 600)).not.toBe(getMiniMapKey(data(40), 800, 600));
+    });
+
+    it('selects only the ground tiles inside the camera window', () => {
+        expect(getGroundTileRange(-20, 30)).toEqual({ first: 0, last: 0 });
+        expect(getGroundTileRange(100, 140)).toEqual({ first: 2, last: 2 });
+    });
+
+    // B-20261017-200200: Given cached ground tiles, When the camera moves past them, Then they are evicted and rebuilt on return
+    it('evicts ground tiles the camera has left', () => {
+        const ctx = createMockCtx();
+        render(ctx, 0, 800, 600, null, null);
+        render(ctx, 1000, 800, 600, null, null);
+        const created = path2DCount.value;
+
+        render(ctx, 0, 800, 600, null, null);
+
+        expect(path2DCount.value).toBe(created + 1);
+    });
+});
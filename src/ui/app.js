@@ -1,8 +1,15 @@
 
 import * as planck from 'planck-js';
 import { createTrack, getTrackHeight } from '../physics/track.js';
-import { buildCar } from '../physics/buildCar.js';
-import { createFirstGeneration, nextGeneration } from '../ga/evolve.js';
+import { buildCar, createCarBlueprint, getBlueprintKey, restoreCar } from '../physics/buildCar.js';
+import { SnapshotPool } from '../physics/carSnapshot.js';
+import { PartIndex } from '../physics/partIndex.js';
+import { CarStateStore, FINISHED, CULLED } from './carStateStore.js';
+import { createFirstGeneration, nextGeneration, evolveGenerations } from '../ga/evolve.js';
+import { FitnessCache, withFitnessCache, hashDNA } from '../ga/fitnessCache.js';
+import { createEvaluationPool } from '../physics/evaluationPool.js';
+import { createRng } from '../utils/random.js';
+import { Profiler } from '../utils/profiler.js';
 import { isJetpackBoostActive, updateJetpackEnergy, canJetpackThrust } from '../physics/jetpack.js';
 import { getInvalidJetpacks } from '../physics/jetpackValidation.js';
 import { render } from '../render/renderWorld.js';
@@ -36,6 +43,9 @@ export class App {
         this.mutRate = options.mutRate ?? 0.05;
         this.maxParts = options.maxParts ?? gameConfig.dna.maxParts;
 
+        // Seeded runs are reproducible: every GA random draw goes through this.rng
+        this.rng = options.seed !== undefined ? createRng(options.seed) : Math.random;
+
         // Economy & State
         this.money = ECONOMY.STARTING_MONEY;
         this.unlockedParts = new Set(['block', 'wheel', 'big_wheel', 'long_body', 'jetpack', 'small_wheel', 'tiny_wheel']);
@@ -43,7 +53,7 @@ export class App {
         this.historicalMaxX = 0;
 
         this.generation = 1;
-        this.population = createFirstGeneration(this.popSize, this.maxParts, this.unlockedParts);
+        this.population = createFirstGeneration(this.popSize, this.maxParts, this.unlockedParts, this.rng);
         this.bestFitnessesByGen = [];
 
         this.running = false;
@@ -51,7 +61,14 @@ export class App {
 
         // Simulation State
         this.world = null;
+        this.track = null;
         this.cars = [];
+        this.partIndex = new PartIndex(); // body -> { carId, partDef, flags }
+        this.blueprints = new Map(); // getBlueprintKey() -> car blueprint (this generation)
+        this.previousBlueprints = new Map();
+        this.snapshotPool = new SnapshotPool();
+        this.carState = new CarStateStore(); // Typed-array mirror of per-car hot state
+        this.brokenCarIndices = []; // Scratch list reused by the joint-break pass
         this.time = 0;
 
         // Staggered car creation
@@ -62,6 +79,15 @@ export class App {
         this.requestRef = null;
         this.statsCallback = null;
         this.cameraX = 0;
+
+        // Headless worker pool for fast-forward (created on first use)
+        this.evaluationPool = null;
+        this.fastForwarding = false;
+        // Headless fitness is deterministic per genome, so it can be cached across generations
+        this.fitnessCache = new FitnessCache();
+
+        // Hot-path timings and counts; off unless requested (see profiler.dump())
+        this.profiler = new Profiler({ enabled: options.profile ?? false });
     }
 
     _explodeJetpack(car, jetpackPartId) {
@@ -78,11 +104,13 @@ export class App {
             // Check if this joint connects the jetpack body
             if (bodyA === jetpackBody || bodyB === jetpackBody) {
                 this.world.destroyJoint(joint);
+                this.carState.removeJoint(joint);
                 car.joints.splice(i, 1);
             }
         }
 
         // Remove the jetpack body from physics world
+        this.partIndex.removeBody(jetpackBody);
         this.world.destroyBody(jetpackBody);
         car.parts.delete(jetpackPartId);
 
@@ -101,17 +129,8 @@ export class App {
 
     _findJetpackBody(bodyA, bodyB) {
         // Check if either body belongs to a jetpack part
-        // We need to match bodies to cars and their parts
-        for (const car of this.cars) {
-            for (const [partId, body] of car.parts) {
-                if (body === bodyA || body === bodyB) {
-                    const partDef = car.dna.parts.find(p => p.id === partId);
-                    if (partDef && partDef.kind === 'jetpack') {
-                        return body;
-                    }
-                }
-            }
-        }
+        if (this.partIndex.isJetpack(bodyA)) return bodyA;
+        if (this.partIndex.isJetpack(bodyB)) return bodyB;
         return null;
     }
 
@@ -126,6 +145,8 @@ export class App {
     }
 
     showToast(msg) {
+        // Headless runs (benchmarks, Node) have no DOM to show toasts in
+        if (typeof document === 'undefined') return;
         const container = document.getElementById('game-container') || document.body;
         const toast = document.createElement('div');
         toast.className = 'toast-notification';
@@ -148,13 +169,38 @@ export class App {
     }
 
     startGeneration() {
-        // Init Physics World
-        this.world = planck.World({
-            gravity: planck.Vec2(0, -9.8),
-        });
+        // Init Physics World once; later generations reuse it and its track
+        if (this.world) {
+            this._clearCars();
+        } else {
+            this._createWorld();
+        }
 
         // Track which jetpack bodies are in contact with track/ground
         this.jetpackContactSet = new Set();
+        this.partIndex.clear();
+
+        // Blueprints of the previous generation stay available for its elites
+        this.previousBlueprints = this.blueprints;
+        this.blueprints = new Map();
+
+        // Build Cars - Staggered across frames in gameplay, all at once in tests
+        this.cars = [];
+        this.time = 0;
+        this.cameraX = 0;
+        this.carsToCreate = [...this.population]; // Queue all cars to create
+        this.creationIndex = 0;
+        this.allCarsCreated = false;
+
+        // Create first batch immediately so tests work and initial frame isn't empty
+        // Subsequent frames will continue staggered creation if more cars remain
+        this.createCarBatch();
+    }
+
+    _createWorld() {
+        this.world = planck.World({
+            gravity: planck.Vec2(0, -9.8),
+        });
 
         // Listen for collisions to detect jetpack-ground contact
         this.world.on('begin-contact', (contact) => {
@@ -178,19 +224,29 @@ export class App {
             }
         });
 
-        createTrack(this.world);
+        this.track = createTrack(this.world);
+    }
 
-        // Build Cars - Staggered across frames in gameplay, all at once in tests
-        this.cars = [];
-        this.time = 0;
-        this.cameraX = 0;
-        this.carsToCreate = [...this.population]; // Queue all cars to create
-        this.creationIndex = 0;
-        this.allCarsCreated = false;
+    _clearCars() {
+        // Remove last generation's cars (destroying a body also destroys its joints)
+        for (const car of this.cars) {
+            if (car.snapshot) this.snapshotPool.release(car.snapshot);
+            if (!car.inSimulation || !car.parts) continue;
+            car.parts.forEach(b => this.world.destroyBody(b));
+        }
+        if (this.track) this.track.reset();
+    }
 
-        // Create first batch immediately so tests work and initial frame isn't empty
-        // Subsequent frames will continue staggered creation if more cars remain
-        this.createCarBatch();
+    _getBlueprint(dna, carId) {
+        // Shapes, fixture and joint definitions depend only on the DNA and its part sprites,
+        // so elites that moved to a new index still find last generation's blueprint
+        const key = getBlueprintKey(dna, carId, hashDNA(dna));
+        let blueprint = this.blueprints.get(key) || this.previousBlueprints.get(key);
+        if (!blueprint) {
+            blueprint = createCarBlueprint(dna, carId);
+        }
+        this.blueprints.set(key, blueprint);
+        return blueprint;
     }
 
     createCarBatch() {
@@ -201,7 +257,8 @@ export class App {
         for (let i = startIdx; i < endIdx; i++) {
             const dna = this.carsToCreate[i];
             const startPos = planck.Vec2(0, 10); // Check QA-001: Increased from 4 to 10 to prevent clipping
-            const { parts, joints } = buildCar(this.world, dna, startPos, i);
+            const blueprint = this._getBlueprint(dna, i);
+            const { parts, joints } = buildCar(this.world, dna, startPos, i, this.partIndex, blueprint);
 
             // Find chassis (root)
             const chassis = parts.get(0);
@@ -228,7 +285,9 @@ export class App {
                 culled: false,
                 velocity: 0,
                 position: 0,
-                energyState: energyState
+                energyState: energyState,
+                blueprint: blueprint,
+                snapshot: null // Parked state while culled
             };
 
             this.cars.push(car);
@@ -237,16 +296,21 @@ export class App {
             this._handleJetpackExplosions(car);
         }
 
+        this._syncCarState();
+
         this.creationIndex = endIdx;
         this.allCarsCreated = this.creationIndex >= this.carsToCreate.length;
     }
 
     loop() {
         if (!this.running) return;
+        const profiler = this.profiler;
 
         // Create cars gradually if generation just started
         if (!this.allCarsCreated) {
+            const start = profiler.enabled ? profiler.now() : 0;
             this.createCarBatch();
+            if (profiler.enabled) profiler.end('createCars', start);
         }
 
         // Speed Multiplier
@@ -258,65 +322,133 @@ export class App {
 
         for (let s = 0; s < steps; s++) {
             if (this.isGenerationFinished()) {
+                const start = profiler.enabled ? profiler.now() : 0;
                 this.evolve();
+                if (profiler.enabled) profiler.end('evolve', start);
                 break;
             }
             this.stepSimulation(dt);
         }
 
         // Render
+        const renderStart = profiler.enabled ? profiler.now() : 0;
         this.draw();
+        if (profiler.enabled) profiler.end('render', renderStart);
 
         if (!this.running) return;
         this.requestRef = requestAnimationFrame(() => this.loop());
     }
 
+    _reactivateCar(car, carX) {
+        const snapshot = car.snapshot;
+        if (!snapshot || !car.blueprint) {
+            // Nothing parked: rebuild at rest on the track
+            const pos = planck.Vec2(carX, getTrackHeight(carX) + 1);
+            return buildCar(this.world, car.dna, pos, car.carId, this.partIndex);
+        }
+
+        // Restore the parked pose, shifted by the distance coasted while culled
+        // and following the terrain; velocities decay with the coasting drag
+        const placement = {
+            dx: carX - snapshot.originX,
+            dy: getTrackHeight(carX) - getTrackHeight(snapshot.originX),
+            velocityScale: snapshot.originVX > 0 ? Math.min(1, car.velocity / snapshot.originVX) : 1
+        };
+        const restored = restoreCar(this.world, car.blueprint, snapshot, car.carId, placement, this.partIndex);
+        this.snapshotPool.release(snapshot);
+        car.snapshot = null;
+        return restored;
+    }
+
+    _syncCarState() {
+        // Rebuild when this.cars was replaced; append rows for newly created cars
+        const state = this.carState;
+        if (state.cars !== this.cars || state.count > this.cars.length) {
+            state.attach(this.cars);
+        }
+        while (state.count < this.cars.length) {
+            state.addCar(this.cars[state.count]);
+        }
+        return state;
+    }
+
+    _finishCar(i) {
+        const state = this.carState;
+        const car = this.cars[i];
+        state.flags[i] |= FINISHED;
+        car.finished = true;
+        car.fitness = Math.max(0, state.maxX[i]);
+
+        if (!(state.flags[i] & CULLED)) {
+            state.removeJoints(car.joints);
+            // Sleep bodies to save CPU (only if in simulation)
+            car.parts.forEach(b => b.setAwake(false));
+        }
+    }
+
     stepSimulation(dt = 1 / 60) {
         this.time += dt;
+        const profiler = this.profiler;
+        const profiling = profiler.enabled;
+        let spanStart = profiling ? profiler.now() : 0;
 
         // Step Physics
         this.world.step(dt);
+        if (profiling) {
+            profiler.end('worldStep', spanStart);
+            spanStart = profiler.now();
+        }
 
-        // Find leader for culling reference (only after some cars created)
-        let leader = null;
-        if (this.cars.length > 0) {
-            const activeCars = this.cars.filter(c => !c.finished && c.inSimulation && c.chassis);
-            if (activeCars.length > 0) {
-                leader = activeCars.reduce((a, b) => a.chassis.getPosition().x > b.chassis.getPosition().x ? a : b);
-            } else {
-                // All cars finished or not yet created, use any with maxX
-                leader = this.cars.reduce((a, b) => a.maxX > b.maxX ? a : b);
+        const state = this._syncCarState();
+        const cars = this.cars;
+        const n = state.count;
+        const { x, y, vx, speed, maxX, lastProgressTime, flags } = state;
+
+        // 1. Sample every running chassis once and find the leader for culling reference
+        let leader = -1;
+        for (let i = 0; i < n; i++) {
+            if (flags[i] & (FINISHED | CULLED)) continue;
+            const chassis = cars[i].chassis;
+            if (!chassis) continue;
+
+            const position = chassis.getPosition();
+            const velocity = chassis.getLinearVelocity();
+            x[i] = position.x;
+            y[i] = position.y;
+            vx[i] = velocity.x;
+            speed[i] = velocity.length();
+
+            if (Number.isFinite(x[i]) && (leader === -1 || x[i] >= x[leader])) {
+                leader = i;
             }
         }
 
-        // Directional Culling: Remove cars far behind champion and keep them coasting
-        if (leader && leader.inSimulation && leader.chassis) {
-            const leaderX = leader.chassis.getPosition().x;
+        // 2. Directional Culling: Remove cars far behind champion and keep them coasting
+        if (leader !== -1) {
+            const leaderX = x[leader];
 
-            this.cars.forEach(car => {
-                if (car.finished) return;
-                // Ensure car has culling properties (for backward compatibility with tests)
-                if (car.inSimulation === undefined) car.inSimulation = true;
-                if (car.culled === undefined) car.culled = false;
-                if (car.velocity === undefined) car.velocity = 0;
-                if (car.position === undefined) car.position = car.maxX;
+            for (let i = 0; i < n; i++) {
+                if (flags[i] & FINISHED) continue;
+                const car = cars[i];
 
-                if (!car.inSimulation) {
+                if (flags[i] & CULLED) {
                     // Car is culled - update using coasting model
                     if (car.velocity > 0) {
                         car.velocity *= DRAG_FACTOR; // Apply drag
                         if (car.velocity < 0.01) car.velocity = 0;
                         car.position += car.velocity * dt;
-                        car.maxX = Math.max(car.maxX, car.position);
+                        if (car.position > maxX[i]) {
+                            maxX[i] = car.position;
+                            car.maxX = car.position;
+                        }
                     }
 
                     // Check if car should be re-added (came back into range)
-                    const relDistance = (car.position || car.maxX) - leaderX;
-                    if (relDistance > -REACTIVATE_DISTANCE && car.dna) {
+                    const carX = car.position || maxX[i];
+                    x[i] = carX;
+                    if (carX - leaderX > -REACTIVATE_DISTANCE && car.dna) {
                         // Re-add to physics world
-                        const trackHeight = getTrackHeight(car.position || car.maxX);
-                        const pos = planck.Vec2(car.position || car.maxX, trackHeight + 1);
-                        const { parts, joints } = buildCar(this.world, car.dna, pos, car.carId);
+                        const { parts, joints } = this._reactivateCar(car, carX);
                         car.parts = parts;
                         car.joints = joints;
                         car.chassis = parts.get(0);
@@ -324,122 +456,154 @@ export class App {
                         car.culled = false;
                         // Energy state is preserved across culling/reactivation
 
+                        flags[i] &= ~CULLED;
+                        if (car.chassis) {
+                            const velocity = car.chassis.getLinearVelocity();
+                            y[i] = car.chassis.getPosition().y;
+                            vx[i] = velocity.x;
+                            speed[i] = velocity.length();
+                        }
+
                         // Check for invalid jetpacks and explode them
                         this._handleJetpackExplosions(car);
+                        state.addJoints(i, car.joints);
                     }
-                } else if (car.inSimulation && car.chassis) {
+                } else if (car.chassis) {
                     // Car is in simulation - check if it should be culled
-                    const carX = car.chassis.getPosition().x;
-                    const relDistance = carX - leaderX; // Negative if behind, positive if ahead
-                    const velocity = Math.abs(car.chassis.getLinearVelocity().x);
-
                     // Only cull if: far behind AND slow moving AND not leader AND has valid dna
-                    if (relDistance < -CULL_DISTANCE_BEHIND &&
-                        velocity < MIN_VELOCITY_TO_CULL &&
-                        car.carId !== leader.carId &&
+                    if (x[i] - leaderX < -CULL_DISTANCE_BEHIND &&
+                        Math.abs(vx[i]) < MIN_VELOCITY_TO_CULL &&
+                        i !== leader &&
                         car.dna) {
 
-                        // Cull: Remove from physics world but track position/velocity
-                        car.velocity = car.chassis.getLinearVelocity().x;
-                        car.position = carX;
+                        // Cull: park the car as a snapshot, then remove it from the physics world
+                        // while tracking position/velocity
+                        car.snapshot = this.snapshotPool.acquire().capture(car);
+                        car.velocity = vx[i];
+                        car.position = x[i];
                         car.culled = true;
                         car.inSimulation = false;
+                        flags[i] |= CULLED;
+                        state.removeJoints(car.joints);
 
                         // Destroy all bodies for this car
-                        car.parts.forEach(b => this.world.destroyBody(b));
+                        car.parts.forEach(b => {
+                            this.partIndex.removeBody(b);
+                            this.jetpackContactSet.delete(b);
+                            this.world.destroyBody(b);
+                        });
                     }
                 }
-            });
+            }
         }
 
-        // Update Cars
-        let activeCount = 0;
-        this.cars.forEach(car => {
-            if (car.finished) return;
-            activeCount++;
+        if (profiling) {
+            profiler.end('cull', spanStart);
+            spanStart = profiler.now();
+        }
 
-            if (car.inSimulation && car.chassis) {
-                const position = car.chassis.getPosition();
-                if (!Number.isFinite(position.x) || !Number.isFinite(position.y)) {
-                    car.finished = true;
-                    car.parts.forEach(b => b.setAwake(false));
-                    car.fitness = Math.max(0, car.maxX);
-                    return;
-                }
+        // 3. Check Joints (Breaking) - one pass over every live joint
+        const invDt = 1 / dt;
+        const joints = state.joints;
+        const brokenCars = this.brokenCarIndices;
+        brokenCars.length = 0;
+        for (let k = joints.length - 1; k >= 0; k--) {
+            const j = joints[k];
+            const data = j.getUserData(); // { breakForce, breakTorque, isBroken, carIndex, flatIndex }
+            const force = j.getReactionForce(invDt);
+            const forceSq = force.x * force.x + force.y * force.y;
+
+            if (forceSq > data.breakForce * data.breakForce ||
+                Math.abs(j.getReactionTorque(invDt)) > data.breakTorque) {
+                const car = cars[data.carIndex];
+                this.world.destroyJoint(j);
+                state.removeJoint(j);
+                car.joints.splice(car.joints.indexOf(j), 1);
+                if (!brokenCars.includes(data.carIndex)) brokenCars.push(data.carIndex);
             }
+        }
 
-            // Apply Jetpack Forces (only for cars in simulation)
-            if (car.inSimulation) {
-                car.parts.forEach((body, partId) => {
-                    const partDef = car.dna.parts.find(p => p.id === partId);
-                    if (partDef && partDef.kind === 'jetpack') {
-                        // Initialize energy state if missing
-                        if (!car.energyState[partId]) {
-                            car.energyState[partId] = { energy: partDef.maxEnergy || 100 };
-                        }
-
-                        // Check if jetpack is in contact with track/ground
-                        const isInContact = this.jetpackContactSet.has(body);
-
-                        // Update energy state
-                        car.energyState[partId] = updateJetpackEnergy(
-                            car.energyState[partId],
-                            partDef,
-                            this.time,
-                            isInContact,
-                            dt
-                        );
-
-                        // Check if boost should be active and energy is available
-                        if (!isJetpackBoostActive(this.time, partDef) || !canJetpackThrust(car.energyState[partId])) {
-                            return;
-                        }
+        if (profiling) {
+            profiler.end('joints', spanStart);
+            spanStart = profiler.now();
+        }
 
-                        // Apply thrust force
-                        const thrust = partDef.thrust || 100;
-                        const f = body.getWorldVector(planck.Vec2(Math.cos(0), Math.sin(0)));
-                        f.mul(thrust);
-                        body.applyForceToCenter(f, true);
-                    }
-                });
+        // After joints break, check if any jetpacks became invalid
+        for (const i of brokenCars) {
+            const car = cars[i];
+            if (this.partIndex.getJetpacks(car.carId).length > 0) {
+                this._handleJetpackExplosions(car);
             }
+        }
+
+        if (profiling) {
+            profiler.end('jetpackValidation', spanStart);
+            spanStart = profiler.now();
+        }
 
-            // Check Joints (Breaking) - only for cars in simulation
-            if (car.inSimulation) {
-                // Iterate backwards to remove
-                for (let i = car.joints.length - 1; i >= 0; i--) {
-                    const j = car.joints[i];
-                    const data = j.getUserData(); // { breakForce, breakTorque, isBroken }
+        // 4. Update Cars: jetpacks, progress, stop conditions and aggregates in one pass
+        let activeCount = 0;
+        let activeInSim = 0;
+        let displayLeader = -1;
+        let best = state.bestIndex;
+        let trailingX = Infinity; // Last unfinished car (culled cars may reactivate there)
+
+        for (let i = 0; i < n; i++) {
+            if (flags[i] & FINISHED) continue;
+            const car = cars[i];
+            const inSim = !(flags[i] & CULLED) && !!car.chassis;
+
+            if (inSim) {
+                if (!Number.isFinite(x[i]) || !Number.isFinite(y[i])) {
+                    this._finishCar(i);
+                    continue;
+                }
 
-                    if (data) {
-                        const rForce = j.getReactionForce(1 / dt).length();
-                        const rTorque = Math.abs(j.getReactionTorque(1 / dt));
+                // Apply Jetpack Forces (only for cars in simulation)
+                for (const { body, partId, partDef } of this.partIndex.getJetpacks(car.carId)) {
+                    // Initialize energy state if missing
+                    if (!car.energyState[partId]) {
+                        car.energyState[partId] = { energy: partDef.maxEnergy || 100 };
+                    }
 
-                        if (rForce > data.breakForce || rTorque > data.breakTorque) {
-                            this.world.destroyJoint(j);
-                            car.joints.splice(i, 1);
-                        }
+                    // Check if jetpack is in contact with track/ground
+                    const isInContact = this.jetpackContactSet.has(body);
+
+                    // Update energy state
+                    car.energyState[partId] = updateJetpackEnergy(
+                        car.energyState[partId],
+                        partDef,
+                        this.time,
+                        isInContact,
+                        dt
+                    );
+
+                    // Check if boost should be active and energy is available
+                    if (!isJetpackBoostActive(this.time, partDef) || !canJetpackThrust(car.energyState[partId])) {
+                        continue;
                     }
-                }
 
-                // After joints break, check if any jetpacks became invalid
-                this._handleJetpackExplosions(car);
-            }
+                    // Apply thrust force
+                    const thrust = partDef.thrust || 100;
+                    const f = body.getWorldVector(planck.Vec2(Math.cos(0), Math.sin(0)));
+                    f.mul(thrust);
+                    body.applyForceToCenter(f, true);
+                }
 
-            // Check Progress
-            if (car.inSimulation && car.chassis) {
-                const x = car.chassis.getPosition().x;
-                if (x > car.maxX + MIN_PROGRESS) {
-                    car.maxX = x;
+                // Check Progress
+                if (x[i] > maxX[i] + MIN_PROGRESS) {
+                    maxX[i] = x[i];
+                    lastProgressTime[i] = this.time;
+                    car.maxX = x[i];
                     car.lastProgressTime = this.time;
                     // Update historical max for mini-map
-                    if (x > this.historicalMaxX) {
-                        this.historicalMaxX = x;
+                    if (x[i] > this.historicalMaxX) {
+                        this.historicalMaxX = x[i];
 
                         // Check for money milestones
                         // e.g. every 50m
-                        if (x > this.lastMilestone + ECONOMY.MILESTONE_DISTANCE) {
-                            const milestonesPassed = Math.floor((x - this.lastMilestone) / ECONOMY.MILESTONE_DISTANCE);
+                        if (x[i] > this.lastMilestone + ECONOMY.MILESTONE_DISTANCE) {
+                            const milestonesPassed = Math.floor((x[i] - this.lastMilestone) / ECONOMY.MILESTONE_DISTANCE);
                             if (milestonesPassed > 0) {
                                 this.addMoney(milestonesPassed * ECONOMY.MONEY_PER_MILESTONE);
                                 this.lastMilestone += milestonesPassed * ECONOMY.MILESTONE_DISTANCE;
@@ -450,29 +614,50 @@ export class App {
                 }
             }
 
+            if (best === -1 || maxX[i] >= maxX[best]) best = i;
+
             // Check Stop Conditions
             // 1. Time limit (global or local?) -> Global 20s max
 
             // 2. Stuck
             let waitLimit = STOP_WAIT;
-            if (car.inSimulation && car.chassis) {
-                const vel = car.chassis.getLinearVelocity().length();
-                if (vel < 0.1) waitLimit = 0.5;
+            if (inSim) {
+                if (speed[i] < 0.1) waitLimit = 0.5;
             } else if (car.culled && car.velocity < 0.1) {
                 // Culled cars: if coasting velocity too low, mark as finished
                 waitLimit = 0;
             }
 
-            if (this.time - car.lastProgressTime > waitLimit) {
-                car.finished = true;
-                // Sleep bodies to save CPU (only if in simulation)
-                if (car.inSimulation) {
-                    car.parts.forEach(b => b.setAwake(false));
-                }
+            if (this.time - lastProgressTime[i] > waitLimit) {
+                this._finishCar(i);
+                continue;
             }
 
-            car.fitness = Math.max(0, car.maxX);
-        });
+            car.fitness = Math.max(0, maxX[i]);
+            activeCount++;
+            if (inSim) activeInSim++;
+            if (x[i] < trailingX) trailingX = x[i];
+            if (displayLeader === -1 || maxX[i] >= maxX[displayLeader]) displayLeader = i;
+        }
+
+        state.activeCount = activeCount;
+        state.activeInSim = activeInSim;
+        state.bestIndex = best;
+        state.displayLeaderIndex = displayLeader;
+
+        // Stream terrain chunks between the last active car and the leader
+        if (this.track && activeCount > 0) {
+            const leaderX = leader !== -1 ? x[leader] : maxX[state.bestIndex];
+            this.track.update(leaderX, trailingX);
+        }
+
+        if (profiling) {
+            profiler.end('carUpdate', spanStart);
+            profiler.count('bodies', this.world.getBodyCount());
+            profiler.count('contacts', this.world.getContactCount());
+            profiler.count('joints', state.joints.length);
+            profiler.count('culledCars', activeCount - activeInSim);
+        }
     }
 
     isGenerationFinished() {
@@ -496,7 +681,8 @@ export class App {
             popSize: this.popSize,
             mutRate: this.mutRate,
             maxParts: this.maxParts,
-            unlockedParts: this.unlockedParts
+            unlockedParts: this.unlockedParts,
+            rng: this.rng
         });
         this.population = nextDNAs;
         this.generation++;
@@ -505,62 +691,38 @@ export class App {
     }
 
     draw() {
-        // Find leader (best fitness so far)
-        // Or check dynamic x?
-        // "Render only the champion (best of generation)"
-        // This could mean "current best" or "best from previous result"?
-        // Usually current leader.
-
-        // Prefer running cars; if all finished, take best overall
-        const runningCars = this.cars.filter(c => !c.finished);
-        let leader;
-        if (runningCars.length > 0) {
-            leader = runningCars.reduce((a, b) => a.maxX > b.maxX ? a : b);
-        } else {
-            leader = this.cars.reduce((a, b) => a.maxX > b.maxX ? a : b);
-        }
+        // Camera follows the running car with the highest maxX; if all finished, the best overall
+        const state = this._syncCarState();
+        const leaderIndex = state.displayLeaderIndex !== -1 ? state.displayLeaderIndex : state.bestIndex;
+        const leader = leaderIndex !== -1 ? this.cars[leaderIndex] : null;
+        const bestFitness = state.bestMaxX;
 
-        const bestFitness = this.cars.length > 0
-            ? Math.max(...this.cars.map(c => c.maxX))
-            : 0;
-
-        // Get leader position (in simulation or culled)
-        let targetCamX = 0;
-        if (leader.inSimulation && leader.chassis) {
-            targetCamX = leader.chassis.getPosition().x;
-        } else if (leader.culled) {
-            targetCamX = leader.position || leader.maxX;
-        } else if (leader.chassis) {
-            targetCamX = leader.chassis.getPosition().x;
-        }
+        // Leader position is tracked by the store (in simulation or culled)
+        const targetCamX = leader ? state.x[leaderIndex] : 0;
 
         // Loose tracking: Lerp towards target
         const lerpFactor = 0.1;
         this.cameraX += (targetCamX - this.cameraX) * lerpFactor;
 
         const cameraX = this.cameraX;
+        const leaderId = leader ? leader.carId : null;
 
-        // Prepare mini-map data
+        // Prepare mini-map data (records are reused between frames)
+        const miniMapCars = state.miniMapCars;
+        for (let i = 0; i < state.count; i++) {
+            miniMapCars[i].x = state.x[i];
+            miniMapCars[i].finished = (state.flags[i] & FINISHED) !== 0;
+        }
         const miniMapData = {
-            cars: this.cars.map(c => {
-                let carX = c.maxX;
-                if (c.inSimulation && c.chassis) {
-                    carX = c.chassis.getPosition().x;
-                } else if (c.culled) {
-                    carX = c.position || c.maxX;
-                }
-                return {
-                    id: c.carId,
-                    x: carX,
-                    finished: c.finished
-                };
-            }),
+            cars: miniMapCars,
             historicalMaxX: this.historicalMaxX,
-            trackedCarId: leader.carId,
+            trackedCarId: leaderId,
             nextMilestone: this.lastMilestone + ECONOMY.MILESTONE_DISTANCE
         };
 
-        render(this.ctx, this.world, cameraX, this.width, this.height, leader.carId, miniMapData);
+        // The champion's own body list spares the renderer a scan of every body in the world
+        const championBodies = leader && leader.parts ? leader.parts : null;
+        render(this.ctx, cameraX, this.width, this.height, miniMapData, championBodies);
 
         // Draw HUD
         this.ctx.fillStyle = 'black';
@@ -568,10 +730,11 @@ export class App {
         this.ctx.fillText(`Gen: ${this.generation}`, 10, 20);
         this.ctx.fillText(`Time: ${this.time.toFixed(1)}s`, 10, 40);
         this.ctx.fillText(`Best: ${bestFitness.toFixed(2)}m`, 10, 60);
-        const activeInSim = this.cars.filter(c => !c.finished && c.inSimulation).length;
-        const activeTotal = this.cars.filter(c => !c.finished).length;
-        this.ctx.fillText(`Active: ${activeInSim}/${activeTotal}/${this.popSize}`, 10, 80);
+        this.ctx.fillText(`Active: ${state.activeInSim}/${state.activeCount}/${this.popSize}`, 10, 80);
         this.ctx.fillText(`Money: $${this.money}`, 10, 100);
+        if (this.profiler.enabled) {
+            this.profiler.drawOverlay(this.ctx, 10, 124);
+        }
 
         if (this.statsCallback) {
             this.statsCallback({
@@ -581,8 +744,62 @@ export class App {
         }
     }
 
+    async fastForward(generations) {
+        // Evaluate whole generations on the worker pool without rendering,
+        // then resume the live simulation with the evolved population.
+        if (this.fastForwarding) return;
+        this.fastForwarding = true;
+
+        const wasRunning = this.running;
+        this.running = false;
+        if (this.requestRef) {
+            cancelAnimationFrame(this.requestRef);
+            this.requestRef = null;
+        }
+
+        try {
+            if (!this.evaluationPool) {
+                this.evaluationPool = await createEvaluationPool();
+            }
+
+            const evaluatePopulation = withFitnessCache(
+                dnas => this.evaluationPool.evaluate(dnas),
+                this.fitnessCache
+            );
+
+            const { population } = await evolveGenerations(
+                this.population,
+                generations,
+                evaluatePopulation,
+                {
+                    popSize: this.popSize,
+                    mutRate: this.mutRate,
+                    maxParts: this.maxParts,
+                    unlockedParts: this.unlockedParts,
+                    rng: this.rng,
+                    onGeneration: (results) => {
+                        const best = results.reduce((a, b) => a.fitness > b.fitness ? a : b);
+                        this.bestFitnessesByGen.push(best.fitness);
+                        this.generation++;
+                    }
+                }
+            );
+
+            this.population = population;
+            this.startGeneration();
+        } finally {
+            this.fastForwarding = false;
+            if (wasRunning && !this.running) {
+                this.running = true;
+                this.loop();
+            }
+        }
+    }
+
     // Controls
     togglePause() {
+        // fastForward() owns the loop until it finishes and resumes it itself
+        if (this.fastForwarding) return;
         if (this.running) {
             this.running = false;
             // Pause: stop the loop by canceling the next frame
@@ -601,8 +818,9 @@ export class App {
     }
 
     reset() {
+        if (this.fastForwarding) return;
         this.generation = 1;
-        this.population = createFirstGeneration(this.popSize, this.maxParts, this.unlockedParts);
+        this.population = createFirstGeneration(this.popSize, this.maxParts, this.unlockedParts, this.rng);
         this.startGeneration();
     }
 
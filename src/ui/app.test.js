@@ -19,7 +19,8 @@ vi.mock('../physics/buildCar.js', () => ({
 }));
 vi.mock('../ga/evolve.js', () => ({
     createFirstGeneration: () => [],
-    nextGeneration: () => []
+    nextGeneration: () => [],
+    evolveGenerations: async (population) => ({ population, results: [] })
 }));
 
 describe('App UI Behavior', () => {
@@ -85,12 +86,11 @@ describe('App UI Behavior', () => {
         // The render function is called with the running car's leaderId
         expect(render).toHaveBeenLastCalledWith(
             expect.anything(),
-            null, // world is null in test environment
             5, // cameraX = running car's position (smoothed)
             expect.anything(),
             expect.anything(),
-            1, // leaderId = running car
-            expect.anything()
+            expect.objectContaining({ trackedCarId: 1 }), // leaderId = running car
+            null // champion body list (mock car has no parts)
         );
     });
 
@@ -117,6 +117,24 @@ describe('App UI Behavior', () => {
         expect(rafSpy).not.toHaveBeenCalled();
     });
 
+    // B-20261017-200100: Given a running app, When pause is toggled during fastForward(), Then only one frame loop resumes
+    it('resumes a single frame loop when pause is toggled during fast-forward', async () => {
+        const mockCtx = { fillStyle: '', font: '', fillText: vi.fn() };
+        const mockCanvas = { getContext: () => mockCtx, width: 800, height: 600 };
+        const app = new App(mockCanvas);
+
+        app.running = true;
+        app.evaluationPool = { evaluate: async () => [] };
+        app.loop = vi.fn();
+
+        const pending = app.fastForward(1);
+        app.togglePause();
+        await pending;
+
+        expect(app.loop).toHaveBeenCalledTimes(1);
+        expect(app.running).toBe(true);
+    });
+
     it('reports best fitness across all cars', () => {
         const mockCtx = { fillStyle: '', font: '', fillText: vi.fn() };
         const mockCanvas = { getContext: () => mockCtx, width: 800, height: 600 };
@@ -214,4 +232,48 @@ describe('App UI Behavior', () => {
 
         expect(app.cars[0].finished).toBe(true);
     });
+
+    // B-20261017-160002: Given profiling is enabled, When a simulation step runs, Then phase spans and world counts are recorded
+    it('records hot-path spans and counts when profiling', () => {
+        const mockCtx = { fillStyle: '', font: '', fillText: vi.fn() };
+        const mockCanvas = { getContext: () => mockCtx, width: 800, height: 600 };
+        const app = new App(mockCanvas, { profile: true });
+
+        app.world = { step: vi.fn(), getBodyCount: () => 3, getContactCount: () => 2 };
+        app.cars = [{
+            carId: 0,
+            parts: [],
+            joints: [],
+            chassis: {
+                getPosition: () => ({ x: 1, y: 0 }),
+                getLinearVelocity: () => ({ x: 1, length: () => 1 })
+            },
+            maxX: 0,
+            lastProgressTime: 0,
+            finished: false,
+            inSimulation: true,
+            culled: false
+        }];
+
+        app.stepSimulation(1 / 60);
+        const { spans, counters } = app.profiler.snapshot();
+
+        expect(Object.keys(spans)).toEqual(['worldStep', 'cull', 'joints', 'jetpackValidation', 'carUpdate']);
+        expect(counters.bodies.last).toBe(3);
+        expect(counters.contacts.last).toBe(2);
+        expect(counters.culledCars.last).toBe(0);
+    });
+
+    // B-20261017-180003: Given a running app, When the next generation starts, Then the physics world is reused
+    it('reuses the physics world across generations', () => {
+        const mockCtx = { fillStyle: '', font: '', fillText: vi.fn() };
+        const mockCanvas = { getContext: () => mockCtx, width: 800, height: 600 };
+        const app = new App(mockCanvas);
+
+        app.startGeneration();
+        const world = app.world;
+        app.startGeneration();
+
+        expect(app.world).toBe(world);
+    });
 });
@@ -0,0 +1,128 @@
+/**
+ * Car State Store
+ * Structure-of-arrays mirror of the per-car values App.stepSimulation and
+ * App.draw touch every step/frame, plus a flat list of live joints so
+ * break checks run as one loop across the whole population.
+ *
+ * Row i always describes app.cars[i]. Car objects stay the public shape
+ * (tests, evolve, mini-map); the store writes back only on state changes.
+ */
+
+export const FINISHED = 1;
+export const CULLED = 2;
+
+const INITIAL_CAPACITY = 64;
+
+export class CarStateStore {
+    constructor() {
+        this.cars = null;
+        this.count = 0;
+        this.capacity = 0;
+        this.joints = []; // Live joints of running, in-simulation cars
+        this.miniMapCars = []; // Reused { id, x, finished } records for the mini-map
+        this._allocate(INITIAL_CAPACITY);
+        this._resetAggregates();
+    }
+
+    _allocate(capacity) {
+        const grow = (old, Type) => {
+            const arr = new Type(capacity);
+            if (old) arr.set(old.subarray(0, this.count));
+            return arr;
+        };
+        this.x = grow(this.x, Float64Array);
+        this.y = grow(this.y, Float64Array);
+        this.vx = grow(this.vx, Float64Array);
+        this.speed = grow(this.speed, Float64Array);
+        this.maxX = grow(this.maxX, Float64Array);
+        this.lastProgressTime = grow(this.lastProgressTime, Float64Array);
+        this.flags = grow(this.flags, Uint8Array);
+        this.capacity = capacity;
+    }
+
+    _resetAggregates() {
+        this.activeCount = 0; // Unfinished cars
+        this.activeInSim = 0; // Unfinished cars with bodies in the world
+        this.bestIndex = -1; // Highest maxX overall
+        this.displayLeaderIndex = -1; // Highest maxX among unfinished cars (camera target)
+    }
+
+    get bestMaxX() {
+        return this.bestIndex === -1 ? 0 : this.maxX[this.bestIndex];
+    }
+
+    /**
+     * Rebuild the store for a (new) cars array
+     */
+    attach(cars) {
+        this.cars = cars;
+        this.count = 0;
+        this.joints.length = 0;
+        this.miniMapCars.length = 0;
+        this._resetAggregates();
+        for (const car of cars) {
+            this.addCar(car);
+        }
+    }
+
+    addCar(car) {
+        if (this.count === this.capacity) {
+            this._allocate(this.capacity * 2);
+        }
+        const i = this.count++;
+
+        const culled = car.culled === true || car.inSimulation === false;
+        const finished = !!car.finished;
+        this.flags[i] = (finished ? FINISHED : 0) | (culled ? CULLED : 0);
+        this.maxX[i] = car.maxX;
+        this.lastProgressTime[i] = car.lastProgressTime;
+        this.x[i] = !culled && car.chassis ? car.chassis.getPosition().x : (car.position || car.maxX);
+        this.y[i] = 0;
+        this.vx[i] = 0;
+        this.speed[i] = 0;
+        this.miniMapCars.push({ id: car.carId, x: this.x[i], finished });
+
+        if (!finished) {
+            this.activeCount++;
+            if (!culled) {
+                this.activeInSim++;
+                this.addJoints(i, car.joints);
+            }
+            if (this.displayLeaderIndex === -1 || car.maxX >= this.maxX[this.displayLeaderIndex]) {
+                this.displayLeaderIndex = i;
+            }
+        }
+        if (this.bestIndex === -1 || car.maxX >= this.maxX[this.bestIndex]) {
+            this.bestIndex = i;
+        }
+        return i;
+    }
+
+    addJoints(carIndex, joints) {
+        for (const joint of joints) {
+            const data = joint.getUserData();
+            if (!data) continue;
+            data.carIndex = carIndex;
+            data.flatIndex = this.joints.length;
+            this.joints.push(joint);
+        }
+    }
+
+    removeJoint(joint) {
+        // Swap-remove; safe while iterating the list backwards
+        const data = joint.getUserData();
+        if (!data || this.joints[data.flatIndex] !== joint) return;
+        const last = this.joints.pop();
+        if (last !== joint) {
+            this.joints[data.flatIndex] = last;
+            last.getUserData().flatIndex = data.flatIndex;
+        }
+        data.flatIndex = -1;
+    }
+
+    removeJoints(joints) {
+        for (const joint of joints) {
+            this.removeJoint(joint);
+        }
+    }
+}
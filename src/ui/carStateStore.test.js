@@ -0,0 +1,70 @@
+import { describe, it, expect } from 'vitest';
+import { CarStateStore, FINISHED, CULLED } from './carStateStore.js';
+
+function mockJoint() {
+    const data = { breakForce: 10, breakTorque: 10 };
+    return { getUserData: () => data };
+}
+
+function mockCar(carId, maxX, extra = {}) {
+    return {
+        carId,
+        maxX,
+        lastProgressTime: 0,
+        finished: false,
+        inSimulation: true,
+        culled: false,
+        joints: [],
+        chassis: { getPosition: () => ({ x: maxX, y: 0 }) },
+        ...extra
+    };
+}
+
+describe('carStateStore.js', () => {
+    // B-20261017-140000: Given running, finished and culled cars, When the store attaches them, Then flags, active counts and leaders match the car objects
+    it('attach mirrors flags and aggregates', () => {
+        const store = new CarStateStore();
+        const cars = [
+            mockCar(0, 100, { finished: true }),
+            mockCar(1, 50),
+            mockCar(2, 20, { culled: true, inSimulation: false, position: 25 })
+        ];
+
+        store.attach(cars);
+
+        expect(store.count).toBe(3);
+        expect(store.flags[0]).toBe(FINISHED);
+        expect(store.flags[2]).toBe(CULLED);
+        expect(store.x[2]).toBe(25);
+        expect(store.activeCount).toBe(2);
+        expect(store.activeInSim).toBe(1);
+        expect(store.bestIndex).toBe(0);
+        expect(store.bestMaxX).toBe(100);
+        expect(store.displayLeaderIndex).toBe(1);
+    });
+
+    // B-20261017-140001: Given the flat joint list, When a joint is removed, Then the last joint fills its slot and keeps a valid index
+    it('removeJoint swap-removes from the flat joint list', () => {
+        const store = new CarStateStore();
+        const joints = [mockJoint(), mockJoint(), mockJoint()];
+        store.attach([mockCar(0, 0, { joints })]);
+
+        store.removeJoint(joints[0]);
+        store.removeJoint(joints[0]); // Already removed: no-op
+
+        expect(store.joints).toEqual([joints[2], joints[1]]);
+        expect(joints[2].getUserData().flatIndex).toBe(0);
+        expect(joints[2].getUserData().carIndex).toBe(0);
+    });
+
+    it('grows its typed arrays past the initial capacity', () => {
+        const store = new CarStateStore();
+        const cars = Array.from({ length: 200 }, (_, i) => mockCar(i, i));
+
+        store.attach(cars);
+
+        expect(store.capacity).toBeGreaterThanOrEqual(200);
+        expect(store.maxX[199]).toBe(199);
+        expect(store.bestIndex).toBe(199);
+    });
+});
@@ -15,6 +15,21 @@ export function initControls(app, doc = document) {
         });
     }
 
+    const fastForwardButton = doc.getElementById('btn-fast-forward');
+    if (fastForwardButton) {
+        fastForwardButton.addEventListener('click', async () => {
+            const generations = parseInt(fastForwardButton.dataset.generations || '10');
+            // Start/Pause and Reset would fight fastForward() over the loop
+            const buttons = [fastForwardButton, startButton, resetButton].filter(Boolean);
+            buttons.forEach(button => { button.disabled = true; });
+            try {
+                await app.fastForward(generations);
+            } finally {
+                buttons.forEach(button => { button.disabled = false; });
+            }
+        });
+    }
+
     const speedSlider = doc.getElementById('speed-slider');
     const speedVal = doc.getElementById('speed-val');
     if (speedSlider) {
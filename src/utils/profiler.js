@@ -0,0 +1,160 @@
+/**
+ * Hot-path profiler
+ * Named spans and counters kept in fixed-size ring buffers, so memory stays
+ * flat however long a session runs. Call sites guard on `profiler.enabled`
+ * before reading the clock, which keeps a disabled profiler free.
+ */
+
+import { summarize } from './stats.js';
+
+const DEFAULT_WINDOW = 240; // Samples kept per metric (~4 s of frames at 60 fps)
+
+const now = typeof performance !== 'undefined' ? () => performance.now() : () => Date.now();
+
+/**
+ * Rolling window of the most recent samples
+ */
+export class RingBuffer {
+  constructor(capacity = DEFAULT_WINDOW) {
+    this.samples = new Float64Array(capacity);
+    this.capacity = capacity;
+    this.count = 0;
+    this.next = 0;
+    this.last = 0;
+  }
+
+  push(value) {
+    this.samples[this.next] = value;
+    this.next = (this.next + 1) % this.capacity;
+    if (this.count < this.capacity) this.count++;
+    this.last = value;
+  }
+
+  /**
+   * Samples oldest first
+   * @returns {number[]}
+   */
+  toArray() {
+    const out = new Array(this.count);
+    const start = (this.next - this.count + this.capacity) % this.capacity;
+    for (let i = 0; i < this.count; i++) {
+      out[i] = this.samples[(start + i) % this.capacity];
+    }
+    return out;
+  }
+
+  clear() {
+    this.count = 0;
+    this.next = 0;
+    this.last = 0;
+  }
+}
+
+export class Profiler {
+  /**
+   * @param {Object} options
+   * @param {boolean} [options.enabled=false]
+   * @param {number} [options.windowSize] - Samples kept per span/counter
+   */
+  constructor({ enabled = false, windowSize = DEFAULT_WINDOW } = {}) {
+    this.enabled = enabled;
+    this.windowSize = windowSize;
+    this.spans = new Map(); // name -> RingBuffer of durations (ms)
+    this.counters = new Map(); // name -> RingBuffer of values
+  }
+
+  enable() {
+    this.enabled = true;
+  }
+
+  disable() {
+    this.enabled = false;
+  }
+
+  now() {
+    return now();
+  }
+
+  _buffer(map, name) {
+    let buffer = map.get(name);
+    if (!buffer) {
+      buffer = new RingBuffer(this.windowSize);
+      map.set(name, buffer);
+    }
+    return buffer;
+  }
+
+  /**
+   * Record a span that started at `start` (from profiler.now())
+   */
+  end(name, start) {
+    if (!this.enabled) return;
+    this._buffer(this.spans, name).push(now() - start);
+  }
+
+  /**
+   * Record a counter value (bodies, contacts, ...)
+   */
+  count(name, value) {
+    if (!this.enabled) return;
+    this._buffer(this.counters, name).push(value);
+  }
+
+  reset() {
+    this.spans.clear();
+    this.counters.clear();
+  }
+
+  /**
+   * Percentile stats for every span (ms) and counter
+   * @returns {Object} { spans: { name: summary }, counters: { name: { last, ...summary } } }
+   */
+  snapshot() {
+    const spans = {};
+    for (const [name, buffer] of this.spans) {
+      spans[name] = summarize(buffer.toArray());
+    }
+    const counters = {};
+    for (const [name, buffer] of this.counters) {
+      counters[name] = { last: buffer.last, ...summarize(buffer.toArray()) };
+    }
+    return { spans, counters };
+  }
+
+  /**
+   * JSON dump with summaries and the raw windows for offline analysis
+   * @returns {string}
+   */
+  dump() {
+    const raw = { spans: {}, counters: {} };
+    for (const [name, buffer] of this.spans) raw.spans[name] = buffer.toArray();
+    for (const [name, buffer] of this.counters) raw.counters[name] = buffer.toArray();
+
+    return JSON.stringify({
+      date: new Date().toISOString(),
+      windowSize: this.windowSize,
+      ...this.snapshot(),
+      raw
+    }, null, 2);
+  }
+
+  /**
+   * Draw span and counter summaries as HUD text lines
+   * @param {CanvasRenderingContext2D} ctx
+   * @param {number} x - Left edge
+   * @param {number} y - Baseline of the first line
+   * @param {number} lineHeight
+   */
+  drawOverlay(ctx, x, y, lineHeight = 16) {
+    const { spans, counters } = this.snapshot();
+    ctx.font = '12px monospace';
+    for (const [name, s] of Object.entries(spans)) {
+      ctx.fillText(`${name}: ${s.mean.toFixed(2)}ms p90 ${s.p90.toFixed(2)} max ${s.max.toFixed(2)}`, x, y);
+      y += lineHeight;
+    }
+    const counts = Object.entries(counters).map(([name, c]) => `${name} ${c.last}`);
+    if (counts.length > 0) {
+      ctx.fillText(counts.join('  '), x, y);
+    }
+  }
+}
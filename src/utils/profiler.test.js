@@ -0,0 +1,36 @@
+import { describe, it, expect } from 'vitest';
+import { Profiler, RingBuffer } from './profiler.js';
+
+describe('profiler.js', () => {
+    // B-20261017-160000: Given a full ring buffer, When more samples are pushed, Then only the most recent window is kept in order
+    it('RingBuffer keeps the most recent samples oldest first', () => {
+        const buffer = new RingBuffer(3);
+        [1, 2, 3, 4, 5].forEach(v => buffer.push(v));
+
+        expect(buffer.toArray()).toEqual([3, 4, 5]);
+        expect(buffer.last).toBe(5);
+    });
+
+    // B-20261017-160001: Given a disabled profiler, When spans and counters are recorded, Then nothing is stored
+    it('records nothing while disabled', () => {
+        const profiler = new Profiler();
+
+        profiler.end('worldStep', profiler.now());
+        profiler.count('bodies', 10);
+
+        expect(profiler.snapshot()).toEqual({ spans: {}, counters: {} });
+    });
+
+    it('dump exports summaries and raw samples as JSON', () => {
+        const profiler = new Profiler({ enabled: true, windowSize: 4 });
+
+        profiler.end('render', profiler.now());
+        profiler.count('bodies', 12);
+        profiler.count('bodies', 8);
+        const dump = JSON.parse(profiler.dump());
+
+        expect(dump.spans.render.count).toBe(1);
+        expect(dump.counters.bodies).toMatchObject({ last: 8, max: 12, count: 2 });
+        expect(dump.raw.counters.bodies).toEqual([12, 8]);
+    });
+});
@@ -0,0 +1,21 @@
+/**
+ * Seedable random number generation
+ * GA functions accept an `rng` argument with the same contract as Math.random
+ * (returns a float in [0, 1)), so a seeded generator makes a whole run reproducible.
+ */
+
+/**
+ * Create a deterministic PRNG (mulberry32)
+ * @param {number} seed - Any 32-bit integer seed
+ * @returns {Function} () => number in [0, 1)
+ */
+export function createRng(seed) {
+  let state = seed >>> 0;
+  return function rng() {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
@@ -0,0 +1,50 @@
+/**
+ * Sample statistics for benchmarks and profiling
+ * Percentiles use linear interpolation between closest ranks, so results are
+ * stable for the small sample counts a seeded benchmark run produces.
+ */
+
+/**
+ * Percentile of an ascending-sorted sample array
+ * @param {ArrayLike<number>} sorted - Samples sorted ascending
+ * @param {number} p - Percentile in [0, 100]
+ * @returns {number} Interpolated value (NaN for no samples)
+ */
+export function percentile(sorted, p) {
+  if (sorted.length === 0) return NaN;
+  const rank = (Math.min(Math.max(p, 0), 100) / 100) * (sorted.length - 1);
+  const lower = Math.floor(rank);
+  const upper = Math.ceil(rank);
+  return sorted[lower] + (sorted[upper] - sorted[lower]) * (rank - lower);
+}
+
+/**
+ * Summarize a set of samples
+ * @param {ArrayLike<number>} samples
+ * @returns {Object} { count, mean, stdev, min, p50, p90, p99, max }
+ */
+export function summarize(samples) {
+  const sorted = Float64Array.from(samples).sort();
+  const count = sorted.length;
+  if (count === 0) {
+    return { count: 0, mean: NaN, stdev: NaN, min: NaN, p50: NaN, p90: NaN, p99: NaN, max: NaN };
+  }
+
+  let sum = 0;
+  for (let i = 0; i < count; i++) sum += sorted[i];
+  const mean = sum / count;
+
+  let sq = 0;
+  for (let i = 0; i < count; i++) sq += (sorted[i] - mean) ** 2;
+
+  return {
+    count,
+    mean,
+    stdev: Math.sqrt(sq / count),
+    min: sorted[0],
+    p50: percentile(sorted, 50),
+    p90: percentile(sorted, 90),
+    p99: percentile(sorted, 99),
+    max: sorted[count - 1]
+  };
+}
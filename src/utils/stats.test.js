@@ -0,0 +1,19 @@
+import { describe, it, expect } from 'vitest';
+import { percentile, summarize } from './stats.js';
+
+describe('stats.js', () => {
+    // B-20261017-150000: Given unsorted samples, When summarize() is called, Then it reports mean, spread and interpolated percentiles
+    it('summarize reports interpolated percentiles', () => {
+        const summary = summarize([4, 1, 3, 2, 5]);
+
+        expect(summary).toMatchObject({ count: 5, mean: 3, min: 1, p50: 3, max: 5 });
+        expect(summary.p90).toBeCloseTo(4.6);
+        expect(summary.stdev).toBeCloseTo(Math.sqrt(2));
+    });
+
+    it('handles empty and single-sample inputs', () => {
+        expect(summarize([]).count).toBe(0);
+        expect(Number.isNaN(percentile([], 50))).toBe(true);
+        expect(summarize([7])).toMatchObject({ mean: 7, p50: 7, p99: 7, stdev: 0 });
+    });
+});
@@ -0,0 +1,8 @@
+import { defineConfig } from 'vite';
+
+export default defineConfig({
+  worker: {
+    // Evaluation workers share modules that use top-level await
+    format: 'es',
+  },
+});